@@ -1,7 +1,9 @@
 """Pydantic models for data validation and serialization."""
 
+import re
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl, ValidationInfo, field_validator
@@ -130,6 +132,12 @@ class DatabaseConnection(BaseModel):
     timeout: float = 30.0
 
 
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a regular expression once per distinct pattern."""
+    return re.compile(pattern)
+
+
 class ExtractionRule(BaseModel):
     """Rule for extracting data from sources."""
 
@@ -154,6 +162,11 @@ class ExtractionRule(BaseModel):
             raise ValueError(f"{field_name} cannot be empty")
         return v
 
+    @property
+    def compiled_regex(self) -> re.Pattern[str] | None:
+        """Compiled ``regex`` pattern, shared by every rule with the same pattern."""
+        return _compile_pattern(self.regex) if self.regex else None
+
 
 class PaginationConfig(BaseModel):
     """Configuration for handling pagination."""
@@ -16,6 +16,12 @@ from scrap_e.core.exceptions import ConnectionError, ScraperError
 from scrap_e.core.models import ExtractionRule, ScraperResult, ScraperType
 from scrap_e.scrapers.web.parser import HtmlParser
 
+# Module-local indirection so tests can stub waits without patching asyncio globally
+_sleep = asyncio.sleep
+
+# Screenshot formats for which Playwright accepts a ``quality`` option
+_QUALITY_SCREENSHOT_FORMATS = frozenset({"jpeg"})
+
 
 class BrowserPageData(BaseModel):
     """Model for scraped browser page data."""
@@ -299,7 +305,7 @@ class BrowserScraper(PaginatedScraper[BrowserPageData, WebScraperConfig]):
 
         # Additional wait time if specified
         if wait_time := kwargs.get("wait_time"):
-            await asyncio.sleep(wait_time)
+            await _sleep(wait_time)
 
     @staticmethod
     async def _scroll_to_bottom(page: Page) -> None:
@@ -350,12 +356,13 @@ class BrowserScraper(PaginatedScraper[BrowserPageData, WebScraperConfig]):
 
     async def _capture_screenshot(self, page: Page, **kwargs: Any) -> bytes:
         """Capture a screenshot of the page."""
-        screenshot_options = {
+        screenshot_format = kwargs.get("screenshot_format", self.config.screenshot_format)
+        screenshot_options: dict[str, Any] = {
             "full_page": kwargs.get("full_page", True),
-            "type": kwargs.get("screenshot_format", self.config.screenshot_format),
+            "type": screenshot_format,
         }
 
-        if screenshot_options["type"] == "jpeg":
+        if screenshot_format in _QUALITY_SCREENSHOT_FORMATS:
             screenshot_options["quality"] = kwargs.get(
                 "screenshot_quality", self.config.screenshot_quality
             )
@@ -496,31 +503,40 @@ class BrowserScraper(PaginatedScraper[BrowserPageData, WebScraperConfig]):
         return None
 
     async def scrape_spa(
-        self, url: str, routes: list[str] | None = None, **kwargs: Any
+        self,
+        url: str,
+        routes: list[str] | None = None,
+        max_concurrent: int | None = None,
+        **kwargs: Any,
     ) -> list[BrowserPageData]:
-        """Scrape a Single Page Application by navigating through routes."""
+        """
+        Scrape a Single Page Application by navigating through routes.
+
+        The initial page and each route are loaded on sibling pages of the shared
+        browser context, at most ``max_concurrent`` at a time (defaulting to
+        ``config.concurrent_requests``). Results keep the order of the initial
+        page followed by ``routes``.
+        """
         if not self._context:
             await self._initialize()
 
         if not self._context:
             raise ScraperError("Browser context not initialized")
 
-        results = []
-        page = await self._context.new_page()
+        context = self._context
+        wait_after = kwargs.get("wait_after_navigation", 1)
+        semaphore = asyncio.Semaphore(max_concurrent or self.config.concurrent_requests)
 
-        try:
-            # Initial navigation
-            await self._navigate_to_page(page, url, **kwargs)
-            await self._wait_for_content(page, **kwargs)
+        async def scrape_route(route: str | None) -> BrowserPageData:
+            async with semaphore:
+                page = await context.new_page()
+                try:
+                    await self._navigate_to_page(page, url, **kwargs)
+                    await self._wait_for_content(page, **kwargs)
 
-            # Scrape initial page
-            initial_data = await self._extract_page_data(page, url)
-            results.append(initial_data)
+                    if route is None:
+                        return await self._extract_page_data(page, url)
 
-            # Navigate through routes if provided
-            if routes:
-                wait_after = kwargs.get("wait_after_navigation", 1)
-                for route in routes:
                     # Navigate to the route (client-side)
                     await page.evaluate(f"window.location.hash = '{route}'")
 
@@ -528,16 +544,13 @@ class BrowserScraper(PaginatedScraper[BrowserPageData, WebScraperConfig]):
                     if wait_after and wait_after > 0:
                         await page.wait_for_timeout(wait_after * 1000)
                     else:
-                        await asyncio.sleep(1)  # Default wait
+                        await _sleep(1)  # Default wait
 
-                    # Extract data from route
-                    route_data = await self._extract_page_data(page, f"{url}#{route}")
-                    results.append(route_data)
+                    return await self._extract_page_data(page, f"{url}#{route}")
+                finally:
+                    await page.close()
 
-        finally:
-            await page.close()
-
-        return results
+        return list(await asyncio.gather(*map(scrape_route, [None, *(routes or [])])))
 
     async def scrape_infinite_scroll(
         self, url: str, max_scrolls: int = 10, **kwargs: Any
@@ -565,7 +578,7 @@ class BrowserScraper(PaginatedScraper[BrowserPageData, WebScraperConfig]):
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
 
                 # Wait for new content to load
-                await asyncio.sleep(wait_between_scrolls)
+                await _sleep(wait_between_scrolls)
 
                 new_height = await page.evaluate("document.body.scrollHeight")
 
@@ -660,10 +673,10 @@ class BrowserScraper(PaginatedScraper[BrowserPageData, WebScraperConfig]):
                     await page.keyboard.press(key)
                 elif action == "wait":
                     wait_time = interaction.get("time", 1)
-                    await asyncio.sleep(wait_time)
+                    await _sleep(wait_time)
 
                 # Wait after each interaction
-                await asyncio.sleep(0.5)
+                await _sleep(0.5)
 
             # Extract page data after interactions
             return await self._extract_page_data(page, url)
@@ -12,7 +12,7 @@ from pydantic import BaseModel, HttpUrl
 
 from scrap_e.core.base_scraper import PaginatedScraper
 from scrap_e.core.config import WebScraperConfig
-from scrap_e.core.exceptions import ConnectionError, ParsingError, ScraperError
+from scrap_e.core.exceptions import ConnectionError, ScraperError
 from scrap_e.core.models import (
     ExtractionRule,
     HttpRequest,
@@ -20,7 +20,9 @@ from scrap_e.core.models import (
     ScraperResult,
     ScraperType,
 )
-from scrap_e.scrapers.web.parser import HtmlParser
+from scrap_e.scrapers.web.parser import CompiledRules, HtmlParser
+
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
 
 
 class WebPageData(BaseModel):
@@ -111,14 +113,20 @@ class HttpScraper(PaginatedScraper[WebPageData, WebScraperConfig]):
             # Make HTTP request
             response = await self._make_request(request)
 
+            # One parser per response, shared by parsing and rule extraction;
+            # its trees are built lazily, so non-HTML bodies never pay for a DOM
+            parser = HtmlParser(response.text, self.config.parser)
+
             # Parse response
-            page_data = await self._parse_response(response, source)
+            page_data = await self._parse_response(response, source, parser)
 
             # Apply extraction rules if provided
             if self.extraction_rules or kwargs.get("extraction_rules"):
                 rules = kwargs.get("extraction_rules", self.extraction_rules)
                 if page_data.content is not None:
-                    page_data.extracted_data = await self._extract_data(page_data.content, rules)
+                    page_data.extracted_data = await self._extract_data(
+                        page_data.content, rules, parser
+                    )
 
             return page_data
 
@@ -185,7 +193,9 @@ class HttpScraper(PaginatedScraper[WebPageData, WebScraperConfig]):
         response.raise_for_status()
         return response
 
-    async def _parse_response(self, response: httpx.Response, _url: str) -> WebPageData:
+    async def _parse_response(
+        self, response: httpx.Response, _url: str, parser: HtmlParser | None = None
+    ) -> WebPageData:
         """Parse HTTP response into WebPageData."""
         content = response.text
 
@@ -196,44 +206,41 @@ class HttpScraper(PaginatedScraper[WebPageData, WebScraperConfig]):
             content=content,
         )
 
+        # Only HTML bodies are worth building a DOM for; a missing header is
+        # treated as HTML so untyped responses keep the full extraction
+        content_type = response.headers.get("content-type", "text/html").lower()
+        if not content or not content_type.startswith(_HTML_CONTENT_TYPES):
+            return page_data
+
+        if parser is None:
+            parser = HtmlParser(content, self.config.parser)
+
         # Extract metadata if configured
-        if self.config.extract_metadata and content:
-            parser = HtmlParser(content)
+        if self.config.extract_metadata:
             page_data.metadata = parser.extract_metadata()
 
         # Extract links if configured
-        if self.config.extract_links and content:
-            parser = HtmlParser(content)
+        if self.config.extract_links:
             page_data.links = parser.extract_links(str(response.url))
 
         # Extract images if configured
-        if self.config.extract_images and content:
-            parser = HtmlParser(content)
+        if self.config.extract_images:
             page_data.images = parser.extract_images(str(response.url))
 
-        # Extract tables if content is available
-        if content:
-            parser = HtmlParser(content)
-            page_data.tables = parser.extract_tables()
+        page_data.tables = parser.extract_tables()
 
         return page_data
 
-    async def _extract_data(self, content: str, rules: list[ExtractionRule]) -> dict[str, Any]:
+    async def _extract_data(
+        self,
+        content: str,
+        rules: list[ExtractionRule] | CompiledRules,
+        parser: HtmlParser | None = None,
+    ) -> dict[str, Any]:
         """Extract data using extraction rules."""
-        parser = HtmlParser(content or "", self.config.parser)
-        extracted = {}
-
-        for rule in rules:
-            try:
-                value = parser.extract_with_rule(rule)
-                extracted[rule.name] = value
-            except ParsingError as e:
-                if rule.required:
-                    raise
-                self.logger.warning(f"Failed to extract {rule.name}: {e!s}")
-                extracted[rule.name] = rule.default
-
-        return extracted
+        if parser is None:
+            parser = HtmlParser(content or "", self.config.parser)
+        return parser.extract_with_rules(rules)
 
     async def _stream_scrape(
         self, source: str, chunk_size: int, **kwargs: Any
@@ -342,6 +349,28 @@ class HttpScraper(PaginatedScraper[WebPageData, WebScraperConfig]):
 
         return None
 
+    async def scrape_multiple(
+        self,
+        sources: list[str],
+        max_concurrent: int | None = None,
+        **kwargs: Any,
+    ) -> list[ScraperResult[WebPageData]]:
+        """
+        Scrape multiple pages, compiling the extraction rules once for all of them.
+
+        Args:
+            sources: List of URLs to scrape
+            max_concurrent: Maximum number of concurrent scraping operations
+            **kwargs: Additional arguments passed to each scrape operation
+
+        Returns:
+            List of ScraperResult objects
+        """
+        rules = kwargs.get("extraction_rules", self.extraction_rules)
+        if rules and not isinstance(rules, CompiledRules):
+            kwargs["extraction_rules"] = CompiledRules(rules)
+        return await super().scrape_multiple(sources, max_concurrent, **kwargs)
+
     def add_extraction_rule(self, rule: ExtractionRule) -> None:
         """Add an extraction rule."""
         self.extraction_rules.append(rule)
@@ -2,43 +2,121 @@
 
 import json
 import re
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import suppress
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
-from lxml import html
+import soupsieve
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
+from lxml import etree, html
 
 try:
-    from selectolax.parser import HTMLParser
+    from selectolax.lexbor import LexborHTMLParser
 
     SELECTOLAX_AVAILABLE = True
 except ImportError:
     SELECTOLAX_AVAILABLE = False
     if TYPE_CHECKING:
         # Dummy type for when selectolax is not available
-        class HTMLParser:  # type: ignore[no-redef]
+        class LexborHTMLParser:  # type: ignore[no-redef]
             pass
 
 
 from scrap_e.core.exceptions import ParsingError
 from scrap_e.core.models import ExtractionRule
 
+_QUERY_CACHE_SIZE = 128
+_JSON_LD_SELECTOR = 'script[type="application/ld+json"]'
+_METADATA_TAGS = ["title", "meta", "html", "link", "script"]
+_FORM_FIELD_TAGS = ["input", "select", "textarea"]
+_METADATA_SELECTOR = f'title, meta, html, link[rel~="canonical"], {_JSON_LD_SELECTOR}'
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(xpath: str) -> etree.XPath:
+    """Compile an XPath expression once and reuse it across rules and parsers."""
+    return etree.XPath(xpath)
+
+
+class CompiledRules:
+    """Extraction rules with their CSS selectors compiled once for reuse across pages."""
+
+    def __init__(self, rules: list[ExtractionRule]) -> None:
+        self.rules = tuple(rules)
+        self.combined: soupsieve.SoupSieve | None = None
+        self.selectors: dict[int, soupsieve.SoupSieve] = {}
+
+        css_rules = [rule for rule in self.rules if rule.selector]
+        if len(css_rules) < 2:
+            return
+        try:
+            self.combined = soupsieve.compile(", ".join(str(rule.selector) for rule in css_rules))
+        except soupsieve.SelectorSyntaxError:
+            # Let each rule surface its own error through extract_with_rule
+            return
+        self.selectors = {id(rule): soupsieve.compile(str(rule.selector)) for rule in css_rules}
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
 
 class HtmlParser:
     """Advanced HTML parser with multiple backend support."""
 
-    def __init__(self, html_content: str, parser_type: str = "lxml") -> None:
+    def __init__(
+        self,
+        html_content: str,
+        parser_type: str = "lxml",
+        parse_only: SoupStrainer | None = None,
+    ) -> None:
         self.html_content = html_content
         self.parser_type = parser_type
+        # Restricts the BeautifulSoup tree to matching elements; lxml/selectolax
+        # trees always cover the whole document
+        self.parse_only = parse_only
         self._soup: BeautifulSoup | None = None
         self._lxml_tree: Any | None = None
         self._selectolax_tree: Any | None = None
+        # Bounded LRU of query results; each entry pins its root node so the
+        # id() in the key cannot be reused while the entry is cached
+        self._query_cache: OrderedDict[tuple[int, str], tuple[Tag, tuple[Tag, ...]]] = OrderedDict()
+
+    @classmethod
+    def from_strainer(
+        cls, html_content: str, strainer: SoupStrainer, parser_type: str = "lxml"
+    ) -> "HtmlParser":
+        """
+        Return a parser whose soup only holds the elements ``strainer`` matches.
+
+        Use this when only a known subset of the document will be inspected;
+        everything outside the strainer is dropped while tokenizing.
+
+        Args:
+            html_content: HTML document to parse
+            strainer: Filter applied while building the BeautifulSoup tree
+            parser_type: BeautifulSoup backend
+
+        Returns:
+            Parser with a strained soup
+        """
+        return cls(html_content, parser_type, parse_only=strainer)
 
     @property
     def soup(self) -> BeautifulSoup:
         """Get BeautifulSoup parser instance."""
         if self._soup is None:
-            self._soup = BeautifulSoup(self.html_content, self.parser_type)
+            try:
+                self._soup = BeautifulSoup(
+                    self.html_content, features=self.parser_type, parse_only=self.parse_only
+                )
+            except FeatureNotFound:
+                # Requested tree builder is not installed; use the stdlib parser
+                self._soup = BeautifulSoup(
+                    self.html_content, features="html.parser", parse_only=self.parse_only
+                )
         return self._soup
 
     @property
@@ -50,13 +128,83 @@ class HtmlParser:
 
     @property
     def selectolax_tree(self) -> Any | None:
-        """Get selectolax parser instance."""
+        """Get selectolax (Lexbor) parser instance."""
         if not SELECTOLAX_AVAILABLE:
             return None
         if self._selectolax_tree is None:
-            self._selectolax_tree = HTMLParser(self.html_content)
+            self._selectolax_tree = LexborHTMLParser(self.html_content)
         return self._selectolax_tree
 
+    def _fast_path_tree(self) -> Any | None:
+        """Return the selectolax tree for the fast extraction paths, if they apply.
+
+        The selectolax tree always covers the whole document, so strained parsers
+        stay on the BeautifulSoup path to honour ``parse_only``.
+        """
+        if self.parse_only is not None:
+            return None
+        return self.selectolax_tree
+
+    def query(self, selector: str) -> tuple[Tag, ...]:
+        """
+        Select elements from the whole document, memoizing the result.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            Matching elements in document order
+        """
+        return self.query_within(self.soup, selector)
+
+    def query_within(self, node: Tag, selector: str) -> tuple[Tag, ...]:
+        """
+        Select elements below ``node``, memoizing the result per node.
+
+        Results are kept in a bounded LRU cache; see ``clear_query_cache``.
+
+        Args:
+            node: Element of this parser's soup to search under
+            selector: CSS selector
+
+        Returns:
+            Matching elements in document order
+        """
+        key = (id(node), selector)
+        entry = self._query_cache.get(key)
+        if entry is not None and entry[0] is node:
+            self._query_cache.move_to_end(key)
+            return entry[1]
+
+        result = tuple(soupsieve.compile(selector).select(node))
+        self._query_cache[key] = (node, result)
+        if len(self._query_cache) > _QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return result
+
+    def clear_query_cache(self) -> None:
+        """
+        Drop memoized query results.
+
+        Call this after modifying ``soup`` so later queries see the changed tree.
+        """
+        self._query_cache.clear()
+
+    def select(self, selector: str) -> list[Tag]:
+        """
+        Select elements with a compiled CSS selector, without memoizing results.
+
+        soupsieve caches compiled selectors, so repeated calls skip straight
+        to matching against the tree.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            Matching elements in document order
+        """
+        return soupsieve.compile(selector).select(self.soup)
+
     def extract_with_rule(self, rule: ExtractionRule) -> Any:
         """
         Extract data using an extraction rule.
@@ -78,25 +226,78 @@ class HtmlParser:
                 return self._extract_json(rule)
             raise ParsingError(f"No extraction method specified in rule: {rule.name}")
         except Exception as e:
-            if rule.required:
-                raise ParsingError(f"Failed to extract required field '{rule.name}': {e!s}") from e
-            return rule.default
+            return self._handle_rule_error(rule, e)
+
+    def extract_with_rules(self, rules: list[ExtractionRule] | CompiledRules) -> dict[str, Any]:
+        """
+        Extract data for several rules, sharing one tree walk between CSS rules.
+
+        Args:
+            rules: Extraction rules to apply, optionally precompiled with
+                ``CompiledRules`` so they can be reused across documents
+
+        Returns:
+            Extracted data keyed by rule name
+        """
+        compiled = rules if isinstance(rules, CompiledRules) else CompiledRules(rules)
+        matches = self._match_css_rules(compiled)
+
+        results: dict[str, Any] = {}
+        for rule in compiled.rules:
+            elements = matches.get(id(rule))
+            if elements is None:
+                results[rule.name] = self.extract_with_rule(rule)
+                continue
+            try:
+                results[rule.name] = self._extract_css_elements(rule, elements)
+            except Exception as e:
+                results[rule.name] = self._handle_rule_error(rule, e)
+        return results
+
+    def _match_css_rules(self, compiled: CompiledRules) -> dict[int, list[Tag]]:
+        """Run the grouped CSS query once and bucket matches per rule."""
+        if compiled.combined is None:
+            return {}
+
+        buckets: dict[int, list[Tag]] = {rule_id: [] for rule_id in compiled.selectors}
+        for element in compiled.combined.select(self.soup):
+            for rule_id, selector in compiled.selectors.items():
+                if selector.match(element):
+                    buckets[rule_id].append(element)
+        return buckets
+
+    @staticmethod
+    def _handle_rule_error(rule: ExtractionRule, error: Exception) -> Any:
+        """Raise for required rules, otherwise fall back to the rule default."""
+        if rule.required:
+            raise ParsingError(
+                f"Failed to extract required field '{rule.name}': {error!s}"
+            ) from error
+        return rule.default
 
     def _extract_css(self, rule: ExtractionRule) -> Any:
         """Extract using CSS selector."""
         if rule.selector is None:
             return rule.default
+        selector = soupsieve.compile(rule.selector)
+        if rule.multiple:
+            return self._extract_css_elements(rule, selector.select(self.soup))
+        element = selector.select_one(self.soup)
+        return self._extract_css_elements(rule, [element] if element else [])
+
+    def _extract_css_elements(self, rule: ExtractionRule, elements: list[Tag]) -> Any:
+        """Extract rule data from already-selected elements."""
         if rule.multiple:
-            elements = self.soup.select(rule.selector)
             return [self._extract_element_data(el, rule) for el in elements]
-        element = self.soup.select_one(rule.selector)
-        if element:
-            return self._extract_element_data(element, rule)
+        if elements:
+            return self._extract_element_data(elements[0], rule)
         return rule.default
 
     def _extract_xpath(self, rule: ExtractionRule) -> Any:
         """Extract using XPath."""
-        results = self.lxml_tree.xpath(rule.xpath)
+        if rule.xpath is None:
+            return rule.default
+        results = _compile_xpath(rule.xpath)(self.lxml_tree)
 
         if not results:
             return rule.default
@@ -107,9 +308,9 @@ class HtmlParser:
 
     def _extract_regex(self, rule: ExtractionRule) -> Any:
         """Extract using regular expression."""
-        if rule.regex is None:
+        pattern = rule.compiled_regex
+        if pattern is None:
             return rule.default
-        pattern = re.compile(rule.regex)
 
         if rule.multiple:
             matches = pattern.findall(self.html_content)
@@ -124,7 +325,7 @@ class HtmlParser:
     def _extract_json(self, rule: ExtractionRule) -> Any:
         """Extract JSON-LD or inline JSON data."""
         # Look for JSON-LD scripts
-        json_scripts = self.soup.find_all("script", type="application/ld+json")
+        json_scripts = self.query(_JSON_LD_SELECTOR)
 
         for script in json_scripts:
             try:
@@ -231,9 +432,10 @@ class HtmlParser:
 
         return result
 
-    def extract_metadata(self) -> dict[str, Any]:
-        """Extract common metadata from HTML."""
-        metadata: dict[str, Any] = {
+    @staticmethod
+    def _empty_metadata() -> dict[str, Any]:
+        """Build the metadata dict with every field unset."""
+        return {
             "title": None,
             "description": None,
             "keywords": None,
@@ -245,103 +447,189 @@ class HtmlParser:
             "schema_data": [],
         }
 
-        # Title
-        title_tag = self.soup.find("title")
-        if title_tag:
-            metadata["title"] = title_tag.get_text(strip=True)
+    @staticmethod
+    def _add_meta_tag(metadata: dict[str, Any], name: str, property: str, content: Any) -> None:
+        """Record a single ``<meta>`` tag in the metadata dict."""
+        if name == "description":
+            metadata["description"] = content
+        elif name == "keywords":
+            metadata["keywords"] = content
+        elif name == "author":
+            metadata["author"] = content
+        elif property.startswith("og:"):
+            metadata["og_data"][property] = content
+            # Also add at top level for backward compatibility
+            metadata[property] = content
+        elif name.startswith("twitter:"):
+            metadata["twitter_data"][name] = content
 
-        # Meta tags
-        for meta in self.soup.find_all("meta"):
-            if not isinstance(meta, Tag):
+    def extract_metadata(self) -> dict[str, Any]:
+        """Extract common metadata from HTML."""
+        tree = self._fast_path_tree()
+        if tree is not None:
+            return self._extract_metadata_selectolax(tree)
+
+        metadata = self._empty_metadata()
+        title_tag = html_tag = canonical = None
+
+        # One walk over the document, dispatching on tag name
+        for tag in self.soup.find_all(_METADATA_TAGS):
+            if not isinstance(tag, Tag):
                 continue
-            name_attr = meta.get("name", "")
-            name = name_attr.lower() if isinstance(name_attr, str) else ""
-            prop_attr = meta.get("property", "")
-            property = prop_attr.lower() if isinstance(prop_attr, str) else ""
-            content = meta.get("content", "")
-
-            if name == "description":
-                metadata["description"] = content
-            elif name == "keywords":
-                metadata["keywords"] = content
-            elif name == "author":
-                metadata["author"] = content
-            elif property.startswith("og:"):
-                metadata["og_data"][property] = content
-                # Also add at top level for backward compatibility
-                metadata[property] = content
-            elif name.startswith("twitter:"):
-                metadata["twitter_data"][name] = content
-
-        # Language
-        html_tag = self.soup.find("html")
-        if html_tag and isinstance(html_tag, Tag):
+            if tag.name == "meta":
+                name_attr = tag.get("name", "")
+                name = name_attr.lower() if isinstance(name_attr, str) else ""
+                prop_attr = tag.get("property", "")
+                property = prop_attr.lower() if isinstance(prop_attr, str) else ""
+                self._add_meta_tag(metadata, name, property, tag.get("content", ""))
+            elif tag.name == "title":
+                title_tag = title_tag or tag
+            elif tag.name == "html":
+                html_tag = html_tag or tag
+            elif tag.name == "link":
+                if canonical is None and "canonical" in (tag.get("rel") or ()):
+                    canonical = tag
+            elif tag.get("type") == "application/ld+json" and tag.string:
+                self._add_schema_data(metadata, tag.string)
+
+        if title_tag is not None:
+            metadata["title"] = title_tag.get_text(strip=True)
+        if html_tag is not None:
             metadata["language"] = html_tag.get("lang")
-
-        # Canonical URL
-        canonical = self.soup.find("link", rel="canonical")
-        if canonical and isinstance(canonical, Tag):
+        if canonical is not None:
             metadata["canonical_url"] = canonical.get("href")
 
-        # Schema.org data
-        json_scripts = self.soup.find_all("script", type="application/ld+json")
-        for script in json_scripts:
-            try:
-                if isinstance(script, Tag) and script.string:
-                    data = json.loads(script.string)
-                else:
-                    continue
-                metadata["schema_data"].append(data)
-            except json.JSONDecodeError:
-                continue
+        return metadata
+
+    def _extract_metadata_selectolax(self, tree: Any) -> dict[str, Any]:
+        """Extract metadata by reading attributes straight off Lexbor nodes."""
+        metadata = self._empty_metadata()
+        title_tag = html_tag = canonical = None
+
+        # One selector query returns every relevant node in document order
+        for node in tree.css(_METADATA_SELECTOR):
+            attrs = node.attributes
+            tag = node.tag
+            if tag == "meta":
+                self._add_meta_tag(
+                    metadata,
+                    (attrs.get("name") or "").lower(),
+                    (attrs.get("property") or "").lower(),
+                    attrs.get("content") or "",
+                )
+            elif tag == "title":
+                title_tag = title_tag or node
+            elif tag == "html":
+                html_tag = html_tag or node
+            elif tag == "link":
+                canonical = canonical or node
+            else:
+                text = node.text()
+                if text:
+                    self._add_schema_data(metadata, text)
+
+        if title_tag is not None:
+            metadata["title"] = title_tag.text(strip=True)
+        if html_tag is not None:
+            metadata["language"] = html_tag.attributes.get("lang")
+        if canonical is not None:
+            metadata["canonical_url"] = canonical.attributes.get("href")
 
         return metadata
 
+    @staticmethod
+    def _add_schema_data(metadata: dict[str, Any], text: str) -> None:
+        """Append a JSON-LD block to the metadata, skipping invalid JSON."""
+        with suppress(json.JSONDecodeError):
+            metadata["schema_data"].append(json.loads(text))
+
     def extract_links(self, absolute_url: str | None = None) -> list[dict[str, str]]:
         """Extract all links from HTML."""
-        links = []
+        return list(self.extract_links_iter(absolute_url))
+
+    def extract_links_iter(self, absolute_url: str | None = None) -> Iterator[dict[str, str]]:
+        """Yield links one at a time instead of building the full list."""
+        tree = self._fast_path_tree()
+        if tree is not None:
+            yield from self._iter_links_selectolax(tree, absolute_url)
+            return
+
         for link in self.soup.find_all("a", href=True):
             if not isinstance(link, Tag):
                 continue
-            href = link.get("href")
-            if not href:
+            attrs = link.attrs
+            href = attrs.get("href")
+            if not href or not isinstance(href, str):
                 continue
-            if absolute_url and isinstance(href, str):
+            if absolute_url:
                 href = urljoin(absolute_url, href)
 
-            if isinstance(href, str):
-                links.append(
-                    {
-                        "url": href,
-                        "text": (link.get_text(strip=True) if isinstance(link, Tag) else ""),
-                        "title": (str(link.get("title", "")) if isinstance(link, Tag) else ""),
-                    }
-                )
+            yield {
+                "url": href,
+                "text": link.get_text(strip=True),
+                "title": str(attrs.get("title", "")),
+            }
 
-        return links
+    @staticmethod
+    def _iter_links_selectolax(tree: Any, absolute_url: str | None) -> Iterator[dict[str, str]]:
+        """Yield links by reading attributes straight off Lexbor nodes."""
+        for link in tree.css("a[href]"):
+            attrs = link.attributes
+            href = attrs.get("href")
+            if not href:
+                continue
+            if absolute_url:
+                href = urljoin(absolute_url, href)
+            yield {
+                "url": href,
+                "text": link.text(strip=True),
+                "title": attrs.get("title") or "",
+            }
 
     def extract_images(self, absolute_url: str | None = None) -> list[dict[str, str]]:
         """Extract all images from HTML."""
-        images = []
+        return list(self.extract_images_iter(absolute_url))
+
+    def extract_images_iter(self, absolute_url: str | None = None) -> Iterator[dict[str, str]]:
+        """Yield images one at a time instead of building the full list."""
+        tree = self._fast_path_tree()
+        if tree is not None:
+            yield from self._iter_images_selectolax(tree, absolute_url)
+            return
+
         for img in self.soup.find_all("img"):
             if not isinstance(img, Tag):
                 continue
-            src_attr = img.get("src", "")
+            attrs = img.attrs
+            src_attr = attrs.get("src", "")
             src = src_attr if isinstance(src_attr, str) else ""
             if absolute_url and src:
                 src = urljoin(absolute_url, src)
 
-            images.append(
-                {
-                    "src": src,
-                    "alt": str(img.get("alt", "")),
-                    "title": str(img.get("title", "")),
-                    "width": str(img.get("width", "")),
-                    "height": str(img.get("height", "")),
-                }
-            )
+            yield {
+                "src": src,
+                "alt": str(attrs.get("alt", "")),
+                "title": str(attrs.get("title", "")),
+                "width": str(attrs.get("width", "")),
+                "height": str(attrs.get("height", "")),
+            }
+
+    @staticmethod
+    def _iter_images_selectolax(tree: Any, absolute_url: str | None) -> Iterator[dict[str, str]]:
+        """Yield images by reading attributes straight off Lexbor nodes."""
+        for img in tree.css("img"):
+            attrs = img.attributes
+            src = attrs.get("src") or ""
+            if absolute_url and src:
+                src = urljoin(absolute_url, src)
 
-        return images
+            yield {
+                "src": src,
+                "alt": attrs.get("alt") or "",
+                "title": attrs.get("title") or "",
+                "width": attrs.get("width") or "",
+                "height": attrs.get("height") or "",
+            }
 
     def extract_forms(self) -> list[dict[str, Any]]:
         """Extract form data from HTML."""
@@ -358,20 +646,21 @@ class HtmlParser:
             }
 
             # Extract all input fields
-            for input_elem in form.find_all(["input", "select", "textarea"]):
+            for input_elem in form.find_all(_FORM_FIELD_TAGS):
                 if not isinstance(input_elem, Tag):
                     continue
+                attrs = input_elem.attrs
                 input_data: dict[str, Any] = {
                     "type": (
-                        str(input_elem.get("type", "text"))
+                        str(attrs.get("type", "text"))
                         if input_elem.name == "input"
                         else input_elem.name
                     ),
-                    "name": input_elem.get("name"),
-                    "id": input_elem.get("id"),
-                    "value": input_elem.get("value"),
-                    "placeholder": input_elem.get("placeholder"),
-                    "required": input_elem.get("required") is not None,
+                    "name": attrs.get("name"),
+                    "id": attrs.get("id"),
+                    "value": attrs.get("value"),
+                    "placeholder": attrs.get("placeholder"),
+                    "required": "required" in attrs,
                 }
 
                 # For select elements, get options
@@ -403,11 +692,7 @@ class HtmlParser:
 
     def extract_all_tables(self) -> list[dict[str, Any]]:
         """Extract all tables from HTML."""
-        return [
-            self._parse_table(table)
-            for table in self.soup.find_all("table")
-            if isinstance(table, Tag)
-        ]
+        return [self._parse_table(table) for table in self.query("table") if isinstance(table, Tag)]
 
     def _parse_table(self, table: Tag) -> dict[str, Any]:
         """Parse a table element into structured data."""
@@ -455,7 +740,7 @@ class HtmlParser:
         """Extract all tables as structured data."""
         tables = []
 
-        for table in self.soup.find_all("table"):
+        for table in self.query("table"):
             if not isinstance(table, Tag):
                 continue
             headers = []
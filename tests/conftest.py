@@ -5,12 +5,16 @@ import gc
 import os
 import sys
 import warnings
+from collections.abc import Callable
+from contextvars import ContextVar
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -20,14 +24,29 @@ sys.path.insert(0, str(project_root / "src"))
 from scrap_e.core.config import ScraperConfig, WebScraperConfig  # noqa: E402
 from scrap_e.core.models import ExtractionRule  # noqa: E402
 from scrap_e.scrapers.web.http_scraper import HttpScraper  # noqa: E402
-from scrap_e.scrapers.web.parser import HtmlParser  # noqa: E402
-from tests.fixtures import BASIC_HTML, create_mock_response  # noqa: E402
+from scrap_e.scrapers.web.parser import SELECTOLAX_AVAILABLE, HtmlParser  # noqa: E402
+from tests.fixtures import (  # noqa: E402
+    BASIC_HTML,
+    EXTRACTION_RULES,
+    LARGE_HTML,
+    MockRouter,
+    create_mock_response,
+)
 
 try:
     from xdist.scheduler import LoadGroupScheduling
 except ImportError:
     LoadGroupScheduling = None
 
+try:
+    # google-re2 is a drop-in, linear-time (DFA-based) replacement for `re`
+    import re2 as dfa_re
+
+    DFA_REGEX_AVAILABLE = True
+except ImportError:
+    dfa_re = None
+    DFA_REGEX_AVAILABLE = False
+
 
 @pytest.fixture
 def basic_html():
@@ -73,14 +92,46 @@ async def http_scraper():
         await scraper._client.aclose()
 
 
-@pytest.fixture
+def _default_httpx_handler(request: httpx.Request) -> httpx.Response:
+    """Answer every request with ``BASIC_HTML``."""
+    return httpx.Response(200, html=BASIC_HTML)
+
+
+# Per-test override for the shared mock transport; see ``httpx_handler``
+_httpx_handler: ContextVar[Callable[[httpx.Request], httpx.Response]] = ContextVar(
+    "httpx_handler", default=_default_httpx_handler
+)
+
+
+def _dispatch_httpx_request(request: httpx.Request) -> httpx.Response:
+    """Route a request to the handler active in the current context."""
+    return _httpx_handler.get()(request)
+
+
+@pytest.fixture(scope="session")
 def mock_httpx_client():
-    """Mock httpx AsyncClient."""
-    with patch("httpx.AsyncClient") as mock:
-        client = MagicMock(spec=AsyncClient)
-        mock.return_value.__aenter__.return_value = client
-        mock.return_value.__aexit__.return_value = None
-        yield client
+    """Real httpx AsyncClient backed by a mock transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_dispatch_httpx_request))
+    yield client
+    asyncio.run(client.aclose())
+
+
+@pytest.fixture
+def httpx_handler():
+    """Override the ``mock_httpx_client`` request handler for a single test."""
+    yield _httpx_handler.set
+    # Async tests set the handler in their own copied context; this only
+    # matters for sync tests, which share the session's context
+    _httpx_handler.set(_default_httpx_handler)
+
+
+@pytest.fixture
+def httpx_router(httpx_handler):
+    """Route ``mock_httpx_client`` requests through a recording ``MockRouter``."""
+    router = MockRouter()
+    router.add("GET", "/", httpx.Response(200, html=BASIC_HTML))
+    httpx_handler(router)
+    return router
 
 
 @pytest.fixture
@@ -92,10 +143,11 @@ def event_loop():
 
 
 # Performance testing fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def benchmark_html():
     """Generate large HTML for performance testing."""
-    items = "\n".join([f'<div class="item-{i}">Content {i}</div>' for i in range(1000)])
+    # map() over a bound str.format keeps the per-item loop in C
+    items = "\n".join(map('<div class="item-{0}">Content {0}</div>'.format, range(1000)))
     return f"""
     <html>
         <body>
@@ -107,18 +159,65 @@ def benchmark_html():
     """
 
 
+@pytest.fixture(scope="session")
+def fast_parser():
+    """``HtmlParser`` over ``LARGE_HTML`` for selectolax micro-benchmarks."""
+    if not SELECTOLAX_AVAILABLE:
+        pytest.skip("selectolax is not installed")
+    return HtmlParser(LARGE_HTML)
+
+
+@pytest.fixture(scope="session")
+def _shared_browser_page():
+    """Mock Playwright page object and a snapshot of its originals, built once.
+
+    Tests get the page through ``page_pool``, which restores it first.
+    """
+    page = SimpleNamespace(
+        url="https://example.com",
+        goto=AsyncMock(return_value=None),
+        title=AsyncMock(return_value="Test Page"),
+        content=AsyncMock(return_value=BASIC_HTML),
+        evaluate=AsyncMock(return_value={}),
+        screenshot=AsyncMock(return_value=b"fake_image"),
+    )
+    originals = {
+        name: (value, value.return_value if isinstance(value, AsyncMock) else None)
+        for name, value in vars(page).items()
+    }
+    return page, originals
+
+
+def reset_page_mock(page: SimpleNamespace, originals: dict[str, tuple[Any, Any]]) -> None:
+    """Restore a shared page mock's attributes, return values and call history."""
+    for name in vars(page).keys() - originals.keys():
+        delattr(page, name)
+    for name, (value, return_value) in originals.items():
+        setattr(page, name, value)
+        if isinstance(value, AsyncMock):
+            value.reset_mock(return_value=True, side_effect=True)
+            value.return_value = return_value
+
+
 @pytest.fixture
-def mock_browser_page():
-    """Mock Playwright page object."""
-    page = MagicMock()
-    page.goto = MagicMock(return_value=asyncio.coroutine(lambda: None)())
-    page.content = MagicMock(return_value=asyncio.coroutine(lambda: BASIC_HTML)())
-    page.evaluate = MagicMock(return_value=asyncio.coroutine(lambda: {})())
-    page.screenshot = MagicMock(return_value=asyncio.coroutine(lambda: b"fake_image")())
+def page_pool(_shared_browser_page):
+    """Hand out the shared page mock, restored to its original state."""
+    page, originals = _shared_browser_page
+    reset_page_mock(page, originals)
     return page
 
 
 # Pytest configuration hooks
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="keep writing .pytest_cache when running under CI",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom settings."""
     # Configure markers
@@ -131,6 +230,11 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "database: mark test as requiring database access")
     config.addinivalue_line("markers", "serial: mark test to run serially (not in parallel)")
 
+    # Cache writes are wasted I/O on throwaway CI runners; pass --cached to keep them
+    cache = getattr(config, "cache", None)
+    if os.environ.get("CI") and cache is not None and not config.getoption("--cached"):
+        cache.set = lambda *args, **kwargs: None
+
     # Set up xdist load scheduling
     if hasattr(config, "workerinput"):
         # We're in a worker process
@@ -182,6 +286,25 @@ def sample_extraction_rules():
     ]
 
 
+@pytest.fixture(scope="session")
+def dfa_regex():
+    """Provide a findall-like re2 matcher over the regex rules in EXTRACTION_RULES.
+
+    Patterns are compiled once per session. Tests using it are skipped when
+    google-re2 is not installed, since the stdlib engine would compare to itself.
+    """
+    if not DFA_REGEX_AVAILABLE:
+        pytest.skip("google-re2 is not installed")
+    compiled = {
+        name: dfa_re.compile(rule.regex) for name, rule in EXTRACTION_RULES.items() if rule.regex
+    }
+
+    def findall(rule_name: str, text: str) -> list[str]:
+        return compiled[rule_name].findall(text)
+
+    return findall
+
+
 @pytest.fixture
 def sample_urls():
     """Provide sample URLs for testing."""
@@ -9,12 +9,13 @@ from .html_samples import (
     MALFORMED_HTML,
     TABLE_HTML,
 )
-from .mock_responses import create_mock_response, mock_http_error
+from .mock_responses import MockRouter, create_mock_response, mock_http_error
 from .test_data import (
     EXTRACTION_RULES,
     SAMPLE_CONFIGS,
     SAMPLE_METADATA,
     SAMPLE_URLS,
+    TEXT_POOL,
 )
 
 __all__ = [
@@ -29,6 +30,8 @@ __all__ = [
     "SAMPLE_METADATA",
     "SAMPLE_URLS",
     "TABLE_HTML",
+    "TEXT_POOL",
+    "MockRouter",
     "create_mock_response",
     "mock_http_error",
 ]
@@ -1,20 +1,85 @@
 """Mock HTTP responses for testing."""
 
+from functools import lru_cache
 from typing import Any
 from unittest.mock import MagicMock
 
 import httpx
 
 
+class FakeResponse:
+    """Lightweight stand-in for ``httpx.Response``.
+
+    Plain attributes instead of ``MagicMock`` auto-attributes, so instances
+    are cheap to build and copy.
+    """
+
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        text: str | bytes,
+        content: bytes,
+        headers: dict[str, str],
+        url: str,
+        json_data: dict[str, Any] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.content = content
+        self.headers = headers
+        self.url = url
+        self.is_success = 200 <= status_code < 300
+        self._json_data = json_data
+
+    def json(self) -> dict[str, Any] | None:
+        """Return the JSON payload."""
+        return self._json_data
+
+    def raise_for_status(self) -> None:
+        """Never raise; error responses are built with ``mock_http_error``."""
+
+    def clone(self) -> "FakeResponse":
+        """Return a copy that does not share mutable state with this response."""
+        return FakeResponse(
+            status_code=self.status_code,
+            text=self.text,
+            content=self.content,
+            headers=dict(self.headers),
+            url=self.url,
+            json_data=self._json_data,
+        )
+
+
+@lru_cache(maxsize=32)
+def _build_response(
+    status_code: int,
+    content: str | bytes,
+    headers_key: tuple[tuple[str, str], ...],
+    url: str,
+) -> FakeResponse:
+    """Build and cache a response template for a hashable kwargs signature."""
+    return FakeResponse(
+        status_code=status_code,
+        text=content,
+        content=content.encode() if isinstance(content, str) else content,
+        headers=dict(headers_key),
+        url=url,
+    )
+
+
 def create_mock_response(
     status_code: int = 200,
     content: str = "",
     headers: dict[str, str] | None = None,
     url: str = "https://example.com",
     json_data: dict[str, Any] | None = None,
-) -> MagicMock:
+) -> FakeResponse:
     """Create a mock HTTP response.
 
+    Responses are built once per distinct signature and cloned on every
+    call, so repeated calls skip re-encoding the content.
+
     Args:
         status_code: HTTP status code
         content: Response text content
@@ -25,22 +90,39 @@ def create_mock_response(
     Returns:
         Mock response object
     """
-    mock_response = MagicMock()
-    mock_response.status_code = status_code
-    mock_response.text = content
-    mock_response.content = content.encode() if isinstance(content, str) else content
-    mock_response.headers = headers or {"content-type": "text/html"}
-    mock_response.url = url
-    mock_response.raise_for_status = MagicMock()
+    headers_key = tuple(sorted((headers or {"content-type": "text/html"}).items()))
+    response = _build_response(status_code, content, headers_key, url).clone()
 
     if json_data is not None:
-        mock_response.json.return_value = json_data
-        mock_response.headers["content-type"] = "application/json"
+        response._json_data = json_data
+        response.headers["content-type"] = "application/json"
 
-    # Add is_success property
-    mock_response.is_success = 200 <= status_code < 300
+    return response
 
-    return mock_response
+
+class MockRouter:
+    """Route table for ``httpx.MockTransport`` that records every request.
+
+    Routes are keyed by ``(method, url)`` so matching is a single dict
+    lookup; requests are recorded in ``calls`` for argument assertions.
+    """
+
+    def __init__(self, base_url: str = "https://example.com") -> None:
+        self.base_url = base_url.rstrip("/")
+        self.routes: dict[tuple[str, str], httpx.Response] = {}
+        self.calls: list[httpx.Request] = []
+
+    def add(self, method: str, path: str, response: httpx.Response) -> None:
+        """Register ``response`` for ``method`` requests to ``path``."""
+        self.routes[method.upper(), self.base_url + path] = response
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request)
+        url = str(request.url.copy_with(query=None, fragment=None))
+        response = self.routes.get((request.method, url))
+        if response is None:
+            return httpx.Response(404, text="No route matched")
+        return response
 
 
 def mock_http_error(
@@ -73,7 +155,7 @@ def create_redirect_response(
     location: str,
     status_code: int = 302,
     original_url: str = "https://example.com",
-) -> MagicMock:
+) -> FakeResponse:
     """Create a mock redirect response.
 
     Args:
@@ -98,7 +180,7 @@ def create_streaming_response(
     chunks: list[str],
     status_code: int = 200,
     url: str = "https://example.com",
-) -> MagicMock:
+) -> FakeResponse:
     """Create a mock streaming response.
 
     Args:
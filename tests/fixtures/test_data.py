@@ -1,5 +1,8 @@
 """Common test data for scrap-e tests."""
 
+import random
+import string
+
 from scrap_e.core.config import ScraperConfig, WebScraperConfig
 from scrap_e.core.models import ExtractionRule
 
@@ -131,6 +134,10 @@ PERFORMANCE_TEST_SIZES = {
     "xlarge": 10000,
 }
 
+# Benchmarks don't need fresh randomness, so every generated article slices
+# this one blob; the fixed seed keeps the corpora identical from run to run
+TEXT_POOL = "".join(random.Random(0).choices(string.ascii_letters + " ", k=200 * 100))
+
 # Test timeouts and delays
 TEST_TIMEOUTS = {
     "fast": 0.1,
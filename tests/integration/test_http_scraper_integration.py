@@ -1,11 +1,37 @@
 """Integration tests for HTTP scraper with parser."""
 
+import httpx
 import pytest
 
 from scrap_e.core.models import ExtractionRule, ScraperType
 from scrap_e.scrapers.web.http_scraper import HttpScraper
 from scrap_e.scrapers.web.parser import HtmlParser
 
+# Sample HTML that might be returned
+INTEGRATION_HTML = """
+<html>
+<head>
+    <title>Integration Test</title>
+    <meta name="description" content="Testing integration">
+</head>
+<body>
+    <h1>Main Title</h1>
+    <div class="content">
+        <p>Paragraph 1</p>
+        <p>Paragraph 2</p>
+    </div>
+    <a href="/link1">Link 1</a>
+    <a href="/link2">Link 2</a>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(scope="module")
+def integration_parser():
+    """Parse the sample page once; the tests only read from the tree."""
+    return HtmlParser(INTEGRATION_HTML)
+
 
 @pytest.mark.asyncio
 class TestHttpScraperIntegration:
@@ -48,46 +74,25 @@ class TestHttpScraperIntegration:
         assert scraper.extraction_rules[1].multiple is True
         assert scraper.extraction_rules[2].required is False
 
-    async def test_scraper_with_parser_integration(self):
+    async def test_scraper_with_parser_integration(self, integration_parser):
         """Test scraper working with parser for data extraction."""
-
-        # Sample HTML that might be returned
-        html = """
-        <html>
-        <head>
-            <title>Integration Test</title>
-            <meta name="description" content="Testing integration">
-        </head>
-        <body>
-            <h1>Main Title</h1>
-            <div class="content">
-                <p>Paragraph 1</p>
-                <p>Paragraph 2</p>
-            </div>
-            <a href="/link1">Link 1</a>
-            <a href="/link2">Link 2</a>
-        </body>
-        </html>
-        """
-
-        # Parse HTML
-        parser = HtmlParser(html)
-
         # Extract metadata
-        metadata = parser.extract_metadata()
+        metadata = integration_parser.extract_metadata()
         assert metadata["title"] == "Integration Test"
         assert metadata["description"] == "Testing integration"
 
-        # Extract links
-        links = parser.extract_links()
-        assert len(links) == 2
-        assert any(link["url"] == "/link1" for link in links)
+        # Extract links, resolved against the page URL
+        links = integration_parser.extract_links("https://example.com/page")
+        assert [link["url"] for link in links] == [
+            "https://example.com/link1",
+            "https://example.com/link2",
+        ]
 
         # Test with extraction rules
-        title_text = parser.soup.select_one("h1").text
+        title_text = integration_parser.soup.select_one("h1").text
         assert title_text == "Main Title"
 
-        paragraphs = parser.soup.select(".content p")
+        paragraphs = integration_parser.soup.select(".content p")
         assert len(paragraphs) == 2
 
     async def test_scraper_session_management(self):
@@ -131,3 +136,35 @@ class TestHttpScraperIntegration:
         name_elem = parser.soup.select_one(".name")
         name = parser._apply_transform(name_elem.text.strip(), "title")
         assert name == "Product Name"
+
+    async def test_scrape_through_mock_transport(self, mock_httpx_client):
+        """Test a full scrape over a real client backed by a mock transport."""
+        scraper = HttpScraper()
+        scraper._client = mock_httpx_client
+
+        page = await scraper._scrape("https://example.com")
+
+        assert page.status_code == 200
+        assert page.metadata["title"] == "Test Page"
+
+    async def test_scrape_with_handler_override(self, mock_httpx_client, httpx_handler):
+        """Test overriding the mock transport handler for one test."""
+        httpx_handler(lambda request: httpx.Response(200, html=f"<p>{request.url.path}</p>"))
+        scraper = HttpScraper()
+        scraper._client = mock_httpx_client
+
+        page = await scraper._scrape("https://example.com/override")
+
+        assert page.content == "<p>/override</p>"
+
+    async def test_scrape_records_routed_request(self, mock_httpx_client, httpx_router):
+        """Test routed requests are recorded for argument assertions."""
+        scraper = HttpScraper()
+        scraper._client = mock_httpx_client
+
+        page = await scraper._scrape("https://example.com/", params={"q": "1"})
+
+        assert page.status_code == 200
+        request = httpx_router.calls[-1]
+        assert request.method == "GET"
+        assert request.url.params["q"] == "1"
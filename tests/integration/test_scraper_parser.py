@@ -1,11 +1,12 @@
 """Integration tests for scraper and parser components."""
 
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import pytest
 
 from scrap_e.core.models import ExtractionRule
 from scrap_e.scrapers.web.http_scraper import HttpScraper
+from scrap_e.scrapers.web.parser import CompiledRules, HtmlParser
 from tests.fixtures import COMPLEX_HTML, TABLE_HTML, create_mock_response
 
 
@@ -127,6 +128,8 @@ class TestHttpScraperParserIntegration:
         ]
 
         mock_response = create_mock_response(content=COMPLEX_HTML)
+        # Responses built from the same body share one bytes buffer
+        assert create_mock_response(content=COMPLEX_HTML).content is mock_response.content
 
         with patch.object(scraper, "_make_request", return_value=mock_response):
             results = await scraper.scrape_multiple(urls)
@@ -137,6 +140,48 @@ class TestHttpScraperParserIntegration:
             assert result.data.extracted_data is not None
             assert "title" in result.data.extracted_data
 
+    @pytest.mark.asyncio
+    async def test_scrape_builds_one_parser_per_response(self):
+        """Test parsing and rule extraction share a single parser per response."""
+        scraper = HttpScraper()
+        scraper.add_extraction_rule(ExtractionRule(name="title", selector="h1"))
+
+        mock_response = create_mock_response(content=COMPLEX_HTML)
+
+        with (
+            patch.object(scraper, "_make_request", return_value=mock_response),
+            patch.object(
+                HtmlParser, "__init__", autospec=True, side_effect=HtmlParser.__init__
+            ) as mock_init,
+        ):
+            result = await scraper.scrape("https://example.com")
+
+        assert result.data.extracted_data["title"]
+        assert result.data.metadata["title"] == "Complex Test Page"
+        assert mock_init.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_scrape_multiple_compiles_rules_once(self):
+        """Test scrape_multiple shares one set of compiled rules across URLs."""
+        scraper = HttpScraper()
+        scraper.add_extraction_rule(ExtractionRule(name="title", selector="h1"))
+        scraper.add_extraction_rule(ExtractionRule(name="links", selector="a", multiple=True))
+
+        mock_response = create_mock_response(content=COMPLEX_HTML)
+
+        with (
+            patch.object(scraper, "_make_request", return_value=mock_response),
+            patch.object(
+                HtmlParser, "extract_with_rules", autospec=True, return_value={}
+            ) as mock_extract,
+        ):
+            await scraper.scrape_multiple(["https://example1.com", "https://example2.com"])
+
+        compiled = {id(call.args[1]) for call in mock_extract.call_args_list}
+        assert mock_extract.call_count == 2
+        assert len(compiled) == 1
+        assert isinstance(mock_extract.call_args.args[1], CompiledRules)
+
 
 class TestParserScraperEdgeCases:
     """Test edge cases in scraper-parser integration."""
@@ -179,12 +224,19 @@ class TestParserScraperEdgeCases:
             content=json_content, headers={"content-type": "application/json"}
         )
 
-        with patch.object(scraper, "_make_request", return_value=mock_response):
+        with (
+            patch.object(scraper, "_make_request", return_value=mock_response),
+            patch.object(HtmlParser, "soup", new_callable=PropertyMock) as mock_soup,
+        ):
             result = await scraper.scrape("https://api.example.com")
 
         assert result.success is True
         assert result.data is not None
         assert json_content in result.data.content
+        # Non-HTML bodies skip DOM construction and HTML-only extraction
+        mock_soup.assert_not_called()
+        assert result.data.metadata is None
+        assert result.data.links is None
 
 
 class TestComplexExtractionScenarios:
@@ -1,12 +1,35 @@
 """Performance benchmark tests for HTML parser operations."""
 
-import random
-import string
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice, pairwise
 
 import pytest
+from bs4 import SoupStrainer
 from lxml import etree
 
-from scrap_e.scrapers.web.parser import HtmlParser
+from scrap_e.scrapers.web.parser import SELECTOLAX_AVAILABLE, HtmlParser
+from tests.fixtures import TEXT_POOL
+
+# Backends compared by the whole-document parse and CSS benchmarks
+BACKENDS = [
+    "lxml",
+    pytest.param(
+        "selectolax",
+        marks=pytest.mark.skipif(not SELECTOLAX_AVAILABLE, reason="selectolax is not installed"),
+    ),
+]
+
+_POST_CLASS = re.compile(r"\bpost-\d+")
+
+# Compiled once at import; each call runs the prepared XPath program in C
+_XPATH_TR = etree.XPath("//tr")
+_XPATH_POST = etree.XPath("//article[starts-with(@class, 'post-')]")
+_XPATH_POST_50_PARAGRAPHS = etree.XPath("//article[@class='post-50']//p")
+_XPATH_TITLE = etree.XPath("./h2")
+_XPATH_CONTENT = etree.XPath("./div[@class='content']")
+_XPATH_TAGS = etree.XPath(".//span[@class='tag']")
+_XPATH_COUNT_NODES = etree.XPath("count(//node())")
 
 
 def generate_html(size: str = "small") -> str:
@@ -31,37 +54,37 @@ def generate_html(size: str = "small") -> str:
         """
     if size == "medium":
         # ~10KB HTML
-        items = []
-        for i in range(100):
-            items.append(f"""
+        items = "".join(
+            f"""
                 <article class="post-{i}">
-                    <h2>Article Title {i}</h2>
+                    <h2><a href="/posts/{i}">Article Title {i}</a></h2>
                     <p class="meta">Posted on 2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}</p>
                     <div class="content">
-                        <p>{"".join(random.choices(string.ascii_letters + " ", k=200))}</p>
+                        <p>{TEXT_POOL[i * 200 : (i + 1) * 200]}</p>
                     </div>
                     <div class="tags">
                         <span class="tag">tag{i % 5}</span>
                         <span class="tag">category{i % 3}</span>
                     </div>
                 </article>
-            """)
+            """
+            for i in range(100)
+        )
         return f"""
         <html>
         <head><title>Medium Test Page</title></head>
         <body>
             <header><h1>Blog Posts</h1></header>
-            <main>{"".join(items)}</main>
+            <main>{items}</main>
             <footer>Copyright 2024</footer>
         </body>
         </html>
         """
     # large
     # ~100KB HTML
-    rows = []
-    for i in range(1000):
-        cells = "".join(f"<td>Cell {i}-{j}</td>" for j in range(10))
-        rows.append(f"<tr>{cells}</tr>")
+    rows = "".join(
+        f"<tr>{''.join(f'<td>Cell {i}-{j}</td>' for j in range(10))}</tr>" for i in range(1000)
+    )
     return f"""
         <html>
         <head><title>Large Test Page</title></head>
@@ -72,7 +95,7 @@ def generate_html(size: str = "small") -> str:
                     <tr>{"".join(f"<th>Column {i}</th>" for i in range(10))}</tr>
                 </thead>
                 <tbody>
-                    {"".join(rows)}
+                    {rows}
                 </tbody>
             </table>
         </body>
@@ -80,14 +103,31 @@ def generate_html(size: str = "small") -> str:
         """
 
 
+@pytest.fixture(scope="session")
+def small_html() -> str:
+    """Small corpus, generated once per session."""
+    return generate_html("small")
+
+
+@pytest.fixture(scope="session")
+def medium_html() -> str:
+    """Medium corpus, generated once per session."""
+    return generate_html("medium")
+
+
+@pytest.fixture(scope="session")
+def large_html() -> str:
+    """Large corpus, generated once per session."""
+    return generate_html("large")
+
+
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_initialization_speed(benchmark):
+def test_parser_initialization_speed(benchmark, small_html):
     """Benchmark HTML parser initialization."""
-    html = generate_html("small")
 
     def init_parser():
-        return HtmlParser(html)
+        return HtmlParser(small_html)
 
     parser = benchmark(init_parser)
     assert parser.soup is not None
@@ -95,12 +135,11 @@ def test_parser_initialization_speed(benchmark):
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_small_html_parsing(benchmark):
+def test_parser_small_html_parsing(benchmark, small_html):
     """Benchmark parsing small HTML documents."""
-    html = generate_html("small")
 
     def parse_html():
-        parser = HtmlParser(html)
+        parser = HtmlParser(small_html)
         return parser.soup.find_all("p")
 
     result = benchmark(parse_html)
@@ -109,13 +148,11 @@ def test_parser_small_html_parsing(benchmark):
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_medium_html_parsing(benchmark):
+def test_parser_medium_html_parsing(benchmark, medium_html):
     """Benchmark parsing medium HTML documents."""
-    html = generate_html("medium")
 
     def parse_html():
-        parser = HtmlParser(html)
-        return parser.soup.find_all("article")
+        return HtmlParser(medium_html).select("article")
 
     result = benchmark(parse_html)
     assert len(result) == 100
@@ -123,71 +160,190 @@ def test_parser_medium_html_parsing(benchmark):
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_large_html_parsing(benchmark):
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parser_large_html_parsing(benchmark, large_html, backend):
     """Benchmark parsing large HTML documents."""
-    html = generate_html("large")
+
+    parsers = {
+        "lxml": lambda: _XPATH_TR(HtmlParser(large_html).lxml_tree),
+        "selectolax": lambda: HtmlParser(large_html).selectolax_tree.css("tr"),
+    }
+
+    result = benchmark(parsers[backend])
+    assert len(result) == 1001
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="parser")
+@pytest.mark.parametrize("method", ["extract_metadata", "extract_links", "select"])
+def test_parser_method_performance(benchmark, medium_html, method):
+    """Benchmark HtmlParser's own extraction methods on the shared document.
+
+    The trees are built by a warm-up call, so the rounds time the parser code itself.
+    """
+    parser = HtmlParser(medium_html)
+    methods = {
+        "extract_metadata": parser.extract_metadata,
+        "extract_links": lambda: parser.extract_links("https://example.com"),
+        "select": lambda: parser.select("article .tags span.tag"),
+    }
+    methods[method]()
+
+    result = benchmark(methods[method])
+
+    if method == "extract_metadata":
+        assert result["title"] == "Medium Test Page"
+    elif method == "extract_links":
+        assert len(result) == 100
+        assert result[-1]["url"] == "https://example.com/posts/99"
+    else:
+        assert len(result) == 200
+
+
+def split_rows(body: str, chunks: int) -> list[str]:
+    """Split a run of ``<tr>`` rows into ``chunks`` pieces on row boundaries."""
+    step = len(body) // chunks
+    bounds = [0]
+    for k in range(1, chunks):
+        bound = body.find("<tr", max(k * step, bounds[-1] + 1))
+        if bound == -1:
+            break
+        bounds.append(bound)
+    bounds.append(len(body))
+    return [body[start:end] for start, end in pairwise(bounds)]
+
+
+def parse_rows(chunk: str) -> list:
+    """Parse a fragment of table rows; lxml releases the GIL while parsing."""
+    return _XPATH_TR(etree.HTML(f"<table>{chunk}</table>"))
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="parser")
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_parser_large_html_chunked_parsing(benchmark, large_html, workers):
+    """Benchmark parsing the large table's rows in parallel, one chunk per worker."""
+    # The rows are independent subtrees, so the tbody splits cleanly between them
+    body = large_html[large_html.index("<tbody>") + len("<tbody>") : large_html.index("</tbody>")]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def parse_html():
+            return list(chain.from_iterable(executor.map(parse_rows, split_rows(body, workers))))
+
+        result = benchmark(parse_html)
+
+    assert len(result) == 1000
+    assert result[-1][9].text == "Cell 999-9"
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="parser")
+def test_parser_large_html_strained_parsing(benchmark, large_html):
+    """Benchmark parsing large HTML into a soup restricted to table rows."""
+    # Only <tr> subtrees are built; everything else is discarded while tokenizing
+    strainer = SoupStrainer("tr")
 
     def parse_html():
-        parser = HtmlParser(html)
+        parser = HtmlParser(large_html, parse_only=strainer)
         return parser.soup.find_all("tr")
 
     result = benchmark(parse_html)
-    assert len(result) > 0
+    assert len(result) == 1001
 
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_css_selector_performance(benchmark):
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parser_css_selector_performance(benchmark, medium_html, backend):
     """Benchmark CSS selector performance."""
-    html = generate_html("medium")
-    parser = HtmlParser(html)
+    parser = HtmlParser(medium_html)
+
+    if backend == "selectolax":
+        tree = parser.selectolax_tree
+
+        def select_elements():
+            return tree.css("article.post-50 .content p")
 
-    def select_elements():
-        return parser.soup.select("article.post-50 .content p")
+    else:
+
+        def select_elements():
+            return parser.select("article.post-50 .content p")
 
     result = benchmark(select_elements)
-    assert result is not None
+    assert len(result) == 1
 
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_xpath_performance(benchmark):
-    """Benchmark XPath selector performance using lxml."""
-    html = generate_html("medium")
+def test_parser_xpath_performance(benchmark, medium_html):
+    """Benchmark XPath selector performance using lxml.
+
+    Only evaluation is timed; tree construction is covered by the
+    ``test_parser_*_html_parsing`` benchmarks.
+    """
+    tree = etree.HTML(medium_html)
 
     def xpath_select():
-        tree = etree.HTML(html)
-        return tree.xpath("//article[@class='post-50']//p")
+        return _XPATH_POST_50_PARAGRAPHS(tree)
 
     result = benchmark(xpath_select)
-    assert result is not None
+    assert len(result) == 2
 
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_find_vs_select_performance(benchmark):
+@pytest.mark.parametrize("method", ["xpath", "find_all", "select"])
+def test_parser_find_vs_select_performance(benchmark, medium_html, method):
     """Compare the performance of find methods vs. CSS selectors."""
-    html = generate_html("medium")
-    parser = HtmlParser(html)
-
-    def find_method():
-        return parser.soup.find_all("article", class_=lambda x: x and "post-" in x)
-
-    result = benchmark(find_method)
+    parser = HtmlParser(medium_html)
+    soup = parser.soup
+    tree = parser.lxml_tree
+
+    # All three match articles whose class starts with "post-", without a
+    # per-element Python callback
+    finders = {
+        "xpath": lambda: _XPATH_POST(tree),
+        "find_all": lambda: soup.find_all("article", class_=_POST_CLASS),
+        "select": lambda: parser.select("article[class^=post-]"),
+    }
+
+    result = benchmark(finders[method])
     assert len(result) == 100
 
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_nested_element_navigation(benchmark):
+def test_parser_nested_element_navigation(benchmark, medium_html):
     """Benchmark navigating nested elements."""
-    html = generate_html("medium")
-    parser = HtmlParser(html)
+    tree = etree.HTML(medium_html)
+
+    def navigate_nested():
+        results = []
+        # Stops walking after the tenth article instead of collecting all 100
+        for article in islice(tree.iter("article"), 10):
+            title = _XPATH_TITLE(article)[0]
+            content = _XPATH_CONTENT(article)[0]
+            tags = _XPATH_TAGS(article)
+            results.append({"title": title, "content": content, "tags": tags})
+        return results
+
+    result = benchmark(navigate_nested)
+    assert len(result) == 10
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="parser")
+def test_parser_strained_nested_navigation(benchmark, medium_html):
+    """Benchmark parsing only <article> subtrees and navigating the first ten."""
+    strainer = SoupStrainer("article")
 
     def navigate_nested():
+        parser = HtmlParser.from_strainer(medium_html, strainer)
         results = []
-        for article in parser.soup.find_all("article")[:10]:
-            title = article.find("h2")
+        # The strained soup's top level is exactly the matched articles
+        for article in parser.soup.contents[:10]:
+            title = article.h2
             content = article.find("div", class_="content")
             tags = article.find_all("span", class_="tag")
             results.append({"title": title, "content": content, "tags": tags})
@@ -195,23 +351,28 @@ def test_parser_nested_element_navigation(benchmark):
 
     result = benchmark(navigate_nested)
     assert len(result) == 10
+    assert all(len(item["tags"]) == 2 for item in result)
 
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_attribute_access_performance(benchmark):
+def test_parser_attribute_access_performance(benchmark, medium_html):
     """Benchmark attribute access patterns."""
-    html = generate_html("medium")
-    parser = HtmlParser(html)
+    parser = HtmlParser(medium_html)
+    tree = parser.lxml_tree
 
     def access_attributes():
         results = []
-        for elem in parser.soup.find_all(class_=True)[:50]:
+        # Lazily filter the walk and stop at 50, rather than materializing
+        # every classed element and slicing
+        classed = (elem for elem in tree.iter(etree.Element) if "class" in elem.attrib)
+        for elem in islice(classed, 50):
+            attrs = elem.attrib
             results.append(
                 {
-                    "class": elem.get("class"),
-                    "id": elem.get("id"),
-                    "text": elem.get_text(strip=True)[:20],
+                    "class": attrs.get("class"),
+                    "id": attrs.get("id"),
+                    "text": elem.text_content().strip()[:20],
                 }
             )
         return results
@@ -222,33 +383,43 @@ def test_parser_attribute_access_performance(benchmark):
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_text_extraction_performance(benchmark):
-    """Benchmark text extraction from HTML."""
-    html = generate_html("large")
-    parser = HtmlParser(html)
+@pytest.mark.parametrize("method", ["text_content", "get_text"])
+def test_parser_text_extraction_performance(benchmark, large_html, method):
+    """Benchmark text extraction from HTML.
 
-    def extract_text():
-        return parser.soup.get_text().strip()
+    ``get_text`` is the BeautifulSoup walk kept as a baseline for lxml's
+    single C-level ``text_content`` call.
+    """
+    parser = HtmlParser(large_html)
+    tree = parser.lxml_tree
+    soup = parser.soup
 
-    result = benchmark(extract_text)
-    assert len(result) > 0
+    extractors = {
+        "text_content": lambda: tree.text_content().strip(),
+        "get_text": lambda: soup.get_text().strip(),
+    }
+
+    result = benchmark(extractors[method])
+    assert "Cell 999-9" in result
 
 
 @pytest.mark.performance
 @pytest.mark.benchmark(group="parser")
-def test_parser_multiple_selector_types(benchmark):
+def test_parser_multiple_selector_types(benchmark, medium_html):
     """Benchmark using multiple selector types together."""
-    html = generate_html("medium")
-    parser = HtmlParser(html)
+    parser = HtmlParser(medium_html)
+    tree = parser.lxml_tree
 
     def mixed_selectors():
         return {
             "css_select": len(parser.soup.select(".tag")),
             "find_all": len(parser.soup.find_all("article")),
             "find": parser.soup.find("h1"),
-            "descendants": sum(1 for _ in parser.soup.descendants),
+            # Counted in C; like soup.descendants this includes text nodes
+            "descendants": int(_XPATH_COUNT_NODES(tree)),
         }
 
     result = benchmark(mixed_selectors)
     assert "css_select" in result
     assert "find_all" in result
+    assert result["descendants"] > result["find_all"]
@@ -1,56 +1,163 @@
 """Advanced tests for BrowserScraper features."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from scrap_e.core.models import ScraperMetadata, ScraperResult, ScraperType
+pytest.importorskip("playwright.async_api")
+
+from scrap_e.core.models import ScraperMetadata, ScraperResult, ScraperStats, ScraperType
+from scrap_e.scrapers.web import browser_scraper as browser_scraper_module
 from scrap_e.scrapers.web.browser_scraper import BrowserPageData, BrowserScraper
 
+pytestmark = [
+    # Keep the module on one xdist worker so the shared mock tree is built once
+    pytest.mark.xdist_group("browser_mock"),
+    pytest.mark.usefixtures("playwright_manager"),
+]
+
+SPA_HTML = "<html><body>SPA Content</body></html>"
+PROXY = {"server": "https://proxy.example.com:8080", "username": "user", "password": "pass"}
+GEOLOCATION = {"latitude": 40.7128, "longitude": -74.0060}
+PAGED_HTML = (
+    "<html><body>Page 1<a href='/page2'>Next</a></body></html>",
+    "<html><body>Page 2<a href='/page3'>Next</a></body></html>",
+    "<html><body>Page 3</body></html>",  # No next link
+)
+
+
+@pytest.fixture(scope="module")
+def _scraper():
+    """Construct the browser scraper once for the whole module."""
+    return BrowserScraper()
+
 
 @pytest.fixture
-async def browser_scraper():
-    """Create a browser scraper instance."""
-    scraper = BrowserScraper()
-    yield scraper
-    if scraper._playwright:
-        await scraper._cleanup()
+def browser_scraper(_scraper):
+    """Hand out the shared scraper and restore the state tests mutate afterwards."""
+    config = _scraper.config.model_copy(deep=True)
+    yield _scraper
+    _scraper.config = config
+    _scraper.stats = ScraperStats()
+    _scraper.extraction_rules = []
+    # The fakes hold no resources, so drop the handles instead of awaiting _cleanup()
+    _scraper._playwright = _scraper._browser = _scraper._context = None
+
+
+class _Recorder:
+    """Awaitable stand-in for a Playwright coroutine method that records its calls.
+
+    ``side_effect`` values are consumed lazily; once exhausted, ``return_value`` is returned.
+    """
+
+    def __init__(self, return_value: Any = None, side_effect: Iterable[Any] | None = None):
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self._return_value = return_value
+        self._side_effect = None if side_effect is None else iter(side_effect)
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self._side_effect is not None:
+            return next(self._side_effect, self._return_value)
+        return self._return_value
+
+
+class _Counter:
+    """Awaitable stand-in that only counts calls, for tests that never inspect arguments."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    async def __call__(self, *_args: Any, **_kwargs: Any) -> None:
+        self.count += 1
+
+
+def _wire_spa_fakes(fakes: Mapping[str, SimpleNamespace]) -> None:
+    """(Re)bind fresh recorders linking the fake Playwright objects.
+
+    Methods only a single test needs (``screenshot``, ``add_cookies``) are left for
+    that test to attach; clearing first drops them again afterwards.
+    """
+    for node in fakes.values():
+        vars(node).clear()
+    page, context, browser = fakes["page"], fakes["context"], fakes["browser"]
+    vars(page).update(
+        url="https://example.com",
+        goto=_Recorder(),
+        wait_for_selector=_Recorder(),
+        wait_for_timeout=_Recorder(),
+        evaluate=_Recorder(),
+        title=_Recorder("SPA Test"),
+        content=_Recorder(SPA_HTML),
+        close=_Recorder(),
+    )
+    vars(context).update(
+        new_page=_Recorder(page),
+        cookies=_Recorder(),
+        close=_Recorder(),
+    )
+    vars(browser).update(new_context=_Recorder(context), close=_Recorder())
+    vars(fakes["playwright"]).update(
+        chromium=SimpleNamespace(launch=_Recorder(browser)), stop=_Recorder()
+    )
+
+
+# Built once at import; the fixture re-binds fresh recorders on these nodes per test
+_SPA_FAKES = MappingProxyType(
+    {
+        "playwright": SimpleNamespace(),
+        "browser": SimpleNamespace(),
+        "context": SimpleNamespace(),
+        "page": SimpleNamespace(),
+    }
+)
 
 
 @pytest.fixture
 def mock_playwright_spa():
-    """Create a mock playwright setup for SPA testing."""
-    mock_page = AsyncMock()
-    mock_page.url = "https://example.com"
-    mock_page.title = AsyncMock(return_value="SPA Test")
-    mock_page.content = AsyncMock(return_value="<html><body>SPA Content</body></html>")
-    mock_page.goto = AsyncMock()
-    mock_page.close = AsyncMock()
-    mock_page.evaluate = AsyncMock()
-    mock_page.wait_for_timeout = AsyncMock()
-    mock_page.screenshot = AsyncMock(return_value=b"screenshot_data")
-
-    mock_context = AsyncMock()
-    mock_context.new_page = AsyncMock(return_value=mock_page)
-    mock_context.close = AsyncMock()
-
-    mock_browser = AsyncMock()
-    mock_browser.new_context = AsyncMock(return_value=mock_context)
-    mock_browser.close = AsyncMock()
-
-    mock_browser_type = AsyncMock()
-    mock_browser_type.launch = AsyncMock(return_value=mock_browser)
-
-    mock_playwright = AsyncMock()
-    mock_playwright.chromium = mock_browser_type
-    mock_playwright.stop = AsyncMock()
-
-    return {
-        "playwright": mock_playwright,
-        "browser": mock_browser,
-        "context": mock_context,
-        "page": mock_page,
-    }
+    """Return the shared fake playwright setup with fresh call recorders."""
+    _wire_spa_fakes(_SPA_FAKES)
+    return _SPA_FAKES
+
+
+@pytest.fixture(scope="module")
+def playwright_manager():
+    """Bind ``async_playwright`` to a shared fake manager for the whole module."""
+    manager = SimpleNamespace(start=_Recorder())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(browser_scraper_module, "async_playwright", lambda: manager)
+        yield manager
+
+
+@pytest.fixture
+def paged_html():
+    """Serve ``PAGED_HTML`` one page per call, repeating the last page once exhausted."""
+    return _Recorder(PAGED_HTML[-1], side_effect=PAGED_HTML)
+
+
+@pytest.fixture(scope="module")
+def page_one_result():
+    """Build the validated first-page result once; tests derive variants with model_copy."""
+    return ScraperResult(
+        success=True,
+        data=BrowserPageData(
+            url="https://example.com/page1",
+            extracted_data={"next_page_url": "https://example.com/page2"},
+        ),
+        metadata=ScraperMetadata(
+            scraper_type=ScraperType.WEB_BROWSER, source="https://example.com/page1"
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _start_spa_fakes(mock_playwright_spa, playwright_manager):
+    """Have the fake manager start the SPA fakes unless a test re-points it."""
+    playwright_manager.start = _Recorder(mock_playwright_spa["playwright"])
 
 
 class TestBrowserScraperAdvanced:
@@ -59,369 +166,239 @@ class TestBrowserScraperAdvanced:
     @pytest.mark.asyncio
     async def test_capture_screenshot(self, browser_scraper):
         """Test screenshot capture."""
-        mock_page = AsyncMock()
-        mock_page.screenshot = AsyncMock(return_value=b"screenshot_data")
+        page = SimpleNamespace(screenshot=_Recorder(b"screenshot_data"))
 
-        screenshot = await browser_scraper._capture_screenshot(mock_page, full_page=False)
+        screenshot = await browser_scraper._capture_screenshot(page, full_page=False)
 
         assert screenshot == b"screenshot_data"
-        mock_page.screenshot.assert_called_once_with(full_page=False, type="png")
+        assert page.screenshot.calls == [((), {"full_page": False, "type": "png"})]
 
     @pytest.mark.asyncio
     async def test_capture_screenshot_jpeg(self, browser_scraper):
         """Test JPEG screenshot capture with quality."""
-        mock_page = AsyncMock()
-        mock_page.screenshot = AsyncMock(return_value=b"jpeg_data")
+        page = SimpleNamespace(screenshot=_Recorder(b"jpeg_data"))
 
         browser_scraper.config.screenshot_format = "jpeg"
         browser_scraper.config.screenshot_quality = 80
 
-        await browser_scraper._capture_screenshot(mock_page)
+        await browser_scraper._capture_screenshot(page)
 
-        mock_page.screenshot.assert_called_once_with(full_page=True, type="jpeg", quality=80)
+        assert page.screenshot.calls == [((), {"full_page": True, "type": "jpeg", "quality": 80})]
 
     @pytest.mark.asyncio
     async def test_scrape_with_screenshot(self, browser_scraper, mock_playwright_spa):
         """Test scraping with screenshot capture."""
         browser_scraper.config.capture_screenshots = True
+        mock_playwright_spa["page"].screenshot = _Recorder(b"screenshot_data")
 
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
-            )
-
-            result = await browser_scraper._scrape("https://example.com")
+        result = await browser_scraper._scrape("https://example.com")
 
-            assert result.screenshot == b"screenshot_data"
-            mock_playwright_spa["page"].screenshot.assert_called_once()
+        assert result.screenshot == b"screenshot_data"
+        assert mock_playwright_spa["page"].screenshot.calls == [
+            ((), {"full_page": True, "type": "png"})
+        ]
 
     @pytest.mark.asyncio
-    async def test_get_next_page(self, browser_scraper):
+    async def test_get_next_page(self, browser_scraper, page_one_result):
         """Test getting next page URL."""
         # Test with extracted data containing the next page URL
-        result = ScraperResult(
-            success=True,
-            data=BrowserPageData(
-                url="https://example.com/page1",
-                extracted_data={"next_page_url": "https://example.com/page2"},
-            ),
-            metadata=ScraperMetadata(
-                scraper_type=ScraperType.WEB_BROWSER, source="https://example.com/page1"
-            ),
+        next_url = await browser_scraper._get_next_page(
+            "https://example.com/page1", page_one_result, 1
         )
-
-        next_url = await browser_scraper._get_next_page("https://example.com/page1", result, 1)
         assert next_url == "https://example.com/page2"
 
-        # Test with no next page
-        result.data.extracted_data = {}
+        # Test with no next page, on a copy so the shared result stays intact
+        result = page_one_result.model_copy(
+            update={"data": page_one_result.data.model_copy(update={"extracted_data": {}})}
+        )
         next_url = await browser_scraper._get_next_page("https://example.com/page1", result, 1)
         assert next_url is None
+        assert page_one_result.data.extracted_data == {"next_page_url": "https://example.com/page2"}
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("<a class='next' href='/page2'>Next</a>", "https://example.com/page2"),
+            ("<a class='next' href='https://other.com/p2'>Next</a>", "https://other.com/p2"),
+            ("<a class='next'>Next</a>", None),
+            ("<a class='prev' href='/page0'>Prev</a>", None),
+        ],
+        ids=["relative", "absolute", "no_href", "no_match"],
+    )
+    @pytest.mark.asyncio
+    async def test_get_next_page_from_selector(
+        self, browser_scraper, page_one_result, content, expected
+    ):
+        """Test the pagination selector resolves the next link against the current page."""
+        browser_scraper.config.pagination.enabled = True
+        browser_scraper.config.pagination.next_page_selector = "a.next"
+        result = page_one_result.model_copy(
+            update={
+                "data": BrowserPageData(
+                    url="https://example.com/page1",
+                    content=f"<html><body>{content}</body></html>",
+                )
+            }
+        )
+
+        next_url = await browser_scraper._get_next_page("https://example.com/page1", result, 1)
+
+        assert next_url == expected
 
     @pytest.mark.asyncio
     async def test_scrape_spa(self, browser_scraper, mock_playwright_spa):
         """Test scraping Single Page Application."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
-            )
+        routes = ["#/about", "#/contact", "#/products"]
+        evaluate = mock_playwright_spa["page"].evaluate = _Counter()
+        results = await browser_scraper.scrape_spa("https://example.com", routes)
 
-            routes = ["#/about", "#/contact", "#/products"]
-            results = await browser_scraper.scrape_spa("https://example.com", routes)
+        assert len(results) == 4  # Initial page + 3 routes
+        assert all(isinstance(r, BrowserPageData) for r in results)
+        # Verify navigation to routes
+        assert evaluate.count >= len(routes)
 
-            assert len(results) == 4  # Initial page + 3 routes
-            assert all(isinstance(r, BrowserPageData) for r in results)
-            # Verify navigation to routes
-            assert mock_playwright_spa["page"].evaluate.call_count >= len(routes)
+    @pytest.mark.asyncio
+    async def test_scrape_spa_visits_routes_concurrently(
+        self, browser_scraper, mock_playwright_spa
+    ):
+        """Test SPA routes are each loaded on their own page, in any order."""
+        routes = ["#/about", "#/contact", "#/products"]
+        page = mock_playwright_spa["page"]
+
+        await browser_scraper.scrape_spa("https://example.com", routes, max_concurrent=2)
+
+        assert len(mock_playwright_spa["context"].new_page.calls) == len(routes) + 1
+        assert len(page.close.calls) == len(routes) + 1
+        assert {args[0] for args, _ in page.evaluate.calls} == {
+            f"window.location.hash = '{route}'" for route in routes
+        }
+        # max_concurrent is a scrape_spa option, not a navigation option
+        assert all("max_concurrent" not in kwargs for _, kwargs in page.goto.calls)
 
     @pytest.mark.asyncio
     async def test_scrape_spa_with_wait_time(self, browser_scraper, mock_playwright_spa):
         """Test SPA scraping with custom wait time."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
-            )
-
-            routes = ["#/page1"]
-            results = await browser_scraper.scrape_spa(
-                "https://example.com", routes, wait_after_navigation=3
-            )
+        routes = ["#/page1"]
+        results = await browser_scraper.scrape_spa(
+            "https://example.com", routes, wait_after_navigation=3
+        )
 
-            assert len(results) == 2
-            # Verify wait was called after navigation
-            assert mock_playwright_spa["page"].wait_for_timeout.called
+        assert len(results) == 2
+        # Verify wait was called after navigation
+        assert mock_playwright_spa["page"].wait_for_timeout.calls
 
     @pytest.mark.asyncio
     async def test_scrape_infinite_scroll(self, browser_scraper, mock_playwright_spa):
         """Test scraping infinite scroll page."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
-            )
-
-            # Simulate scroll height changes
-            scroll_heights = [1000, 2000, 3000, 3000]  # The last scroll shows no new content
-            mock_playwright_spa["page"].evaluate = AsyncMock(
-                side_effect=scroll_heights + [None] * 10
-            )
+        # Simulate scroll height changes
+        scroll_heights = [1000, 2000, 3000, 3000]  # The last scroll shows no new content
+        mock_playwright_spa["page"].evaluate = _Recorder(side_effect=scroll_heights)
 
-            result = await browser_scraper.scrape_infinite_scroll(
-                "https://example.com", max_scrolls=5
-            )
+        result = await browser_scraper.scrape_infinite_scroll("https://example.com", max_scrolls=5)
 
-            assert isinstance(result, BrowserPageData)
-            # Verify scrolling occurred
-            assert mock_playwright_spa["page"].evaluate.call_count >= 4
+        assert isinstance(result, BrowserPageData)
+        # Verify scrolling occurred
+        assert len(mock_playwright_spa["page"].evaluate.calls) >= 4
 
     @pytest.mark.asyncio
     async def test_scrape_infinite_scroll_with_wait(self, browser_scraper, mock_playwright_spa):
         """Test infinite scroll with wait between scrolls."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
-            )
-
-            # Simulate the immediate end (no new content)
-            # Need values for: scrollHeight, scrollTo, scrollHeight again
-            mock_playwright_spa["page"].evaluate = AsyncMock(side_effect=[1000, None, 1000])
+        # Simulate the immediate end (no new content)
+        # Need values for: scrollHeight, scrollTo, scrollHeight again
+        mock_playwright_spa["page"].evaluate = _Recorder(side_effect=[1000, None, 1000])
 
-            with patch("asyncio.sleep") as mock_sleep:
-                result = await browser_scraper.scrape_infinite_scroll(
-                    "https://example.com", max_scrolls=3, wait_between_scrolls=2
-                )
+        with patch("scrap_e.scrapers.web.browser_scraper._sleep", new=_Recorder()) as sleep:
+            result = await browser_scraper.scrape_infinite_scroll(
+                "https://example.com", max_scrolls=3, wait_between_scrolls=2
+            )
 
-                assert isinstance(result, BrowserPageData)
-                # Should have waited between scrolls
-                assert mock_sleep.called
+            assert isinstance(result, BrowserPageData)
+            # Should have waited once between the two height reads
+            assert sleep.calls == [((2,), {})]
 
     @pytest.mark.asyncio
-    async def test_scrape_paginated(self, browser_scraper, mock_playwright_spa):
+    async def test_scrape_paginated(self, browser_scraper, mock_playwright_spa, paged_html):
         """Test paginated scraping."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
-            )
+        mock_playwright_spa["page"].content = paged_html
 
-            # Mock different page contents
-            page_contents = [
-                "<html><body>Page 1<a href='/page2'>Next</a></body></html>",
-                "<html><body>Page 2<a href='/page3'>Next</a></body></html>",
-                "<html><body>Page 3</body></html>",  # No next link
+        # Mock _get_next_page to return appropriate URLs
+        with patch.object(browser_scraper, "_get_next_page") as mock_get_next:
+            mock_get_next.side_effect = [
+                "https://example.com/page2",
+                "https://example.com/page3",
+                None,
             ]
-            mock_playwright_spa["page"].content = AsyncMock(side_effect=page_contents)
-
-            # Mock _get_next_page to return appropriate URLs
-            with patch.object(browser_scraper, "_get_next_page") as mock_get_next:
-                mock_get_next.side_effect = [
-                    "https://example.com/page2",
-                    "https://example.com/page3",
-                    None,
-                ]
-
-                results = await browser_scraper.scrape_paginated(
-                    "https://example.com/page1", max_pages=3
-                )
 
-                assert len(results) == 3
-                assert all(isinstance(r.data, BrowserPageData) for r in results)
-
-    @pytest.mark.asyncio
-    async def test_scrape_with_cookies(self, browser_scraper, mock_playwright_spa):
-        """Test scraping with initial cookies."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
+            results = await browser_scraper.scrape_paginated(
+                "https://example.com/page1", max_pages=3
             )
 
-            cookies = [
-                {"name": "session", "value": "abc123", "domain": ".example.com", "path": "/"},
-                {"name": "user_id", "value": "42", "domain": ".example.com", "path": "/"},
-            ]
-
-            mock_playwright_spa["context"].add_cookies = AsyncMock()
-
-            await browser_scraper._scrape("https://example.com", cookies=cookies)
-
-            mock_playwright_spa["context"].add_cookies.assert_called_once_with(cookies)
-
-    @pytest.mark.asyncio
-    async def test_scrape_with_proxy(self, browser_scraper):
-        """Test scraping with proxy configuration."""
-        browser_scraper.config.proxy = {
-            "server": "https://proxy.example.com:8080",
-            "username": "user",
-            "password": "pass",
-        }
-
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-
-        mock_browser_type = AsyncMock()
-        mock_browser_type.launch = AsyncMock(return_value=mock_browser)
-
-        mock_playwright = AsyncMock()
-        mock_playwright.chromium = mock_browser_type
-        mock_playwright.stop = AsyncMock()
-
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(return_value=mock_playwright)
-
-            await browser_scraper._initialize()
-
-            # Verify proxy was passed to context creation
-            context_call = mock_browser.new_context.call_args
-            assert "proxy" in context_call[1]
-            assert context_call[1]["proxy"]["server"] == "https://proxy.example.com:8080"
-
-    @pytest.mark.asyncio
-    async def test_scrape_with_user_agent(self, browser_scraper):
-        """Test scraping with a custom user agent."""
-        browser_scraper.config.user_agent = "CustomBot/1.0"
-
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-
-        mock_browser_type = AsyncMock()
-        mock_browser_type.launch = AsyncMock(return_value=mock_browser)
-
-        mock_playwright = AsyncMock()
-        mock_playwright.chromium = mock_browser_type
-        mock_playwright.stop = AsyncMock()
-
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(return_value=mock_playwright)
-
-            await browser_scraper._initialize()
-
-            # Verify the user agent was passed to context creation
-            context_call = mock_browser.new_context.call_args
-            assert context_call[1]["user_agent"] == "CustomBot/1.0"
-
-    @pytest.mark.asyncio
-    async def test_scrape_with_viewport(self, browser_scraper):
-        """Test scraping with a custom viewport size."""
-        browser_scraper.config.viewport_width = 1920
-        browser_scraper.config.viewport_height = 1080
-
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-
-        mock_browser_type = AsyncMock()
-        mock_browser_type.launch = AsyncMock(return_value=mock_browser)
-
-        mock_playwright = AsyncMock()
-        mock_playwright.chromium = mock_browser_type
-        mock_playwright.stop = AsyncMock()
-
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(return_value=mock_playwright)
-
-            await browser_scraper._initialize()
-
-            # Verify the viewport was set
-            context_call = mock_browser.new_context.call_args
-            assert context_call[1]["viewport"]["width"] == 1920
-            assert context_call[1]["viewport"]["height"] == 1080
+            assert len(results) == 3
+            assert all(isinstance(r.data, BrowserPageData) for r in results)
 
     @pytest.mark.asyncio
-    async def test_scrape_with_geolocation(self, browser_scraper):
-        """Test scraping with geolocation settings."""
-        browser_scraper.config.geolocation = {"latitude": 40.7128, "longitude": -74.0060}
-        browser_scraper.config.permissions = ["geolocation"]
-
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-
-        mock_browser_type = AsyncMock()
-        mock_browser_type.launch = AsyncMock(return_value=mock_browser)
-
-        mock_playwright = AsyncMock()
-        mock_playwright.chromium = mock_browser_type
-        mock_playwright.stop = AsyncMock()
-
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(return_value=mock_playwright)
+    async def test_scrape_with_cookies(self, browser_scraper, mock_playwright_spa):
+        """Test scraping with initial cookies."""
+        cookies = [
+            {"name": "session", "value": "abc123", "domain": ".example.com", "path": "/"},
+            {"name": "user_id", "value": "42", "domain": ".example.com", "path": "/"},
+        ]
+        mock_playwright_spa["context"].add_cookies = _Recorder()
 
-            await browser_scraper._initialize()
+        await browser_scraper._scrape("https://example.com", cookies=cookies)
 
-            # Verify geolocation was set
-            context_call = mock_browser.new_context.call_args
-            assert "geolocation" in context_call[1]
-            assert context_call[1]["geolocation"]["latitude"] == 40.7128
-            assert "permissions" in context_call[1]
-            assert "geolocation" in context_call[1]["permissions"]
+        assert mock_playwright_spa["context"].add_cookies.calls == [((cookies,), {})]
 
     @pytest.mark.asyncio
-    async def test_scrape_with_offline_mode(self, browser_scraper):
-        """Test scraping in offline mode."""
-        browser_scraper.config.offline = True
-
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-
-        mock_browser_type = AsyncMock()
-        mock_browser_type.launch = AsyncMock(return_value=mock_browser)
-
-        mock_playwright = AsyncMock()
-        mock_playwright.chromium = mock_browser_type
-        mock_playwright.stop = AsyncMock()
-
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(return_value=mock_playwright)
-
-            await browser_scraper._initialize()
-
-            # Verify offline mode was set
-            context_call = mock_browser.new_context.call_args
-            assert context_call[1]["offline"] is True
+    async def test_initialize_passes_all_context_options(
+        self, browser_scraper, mock_playwright_spa
+    ):
+        """Test every configured context option reaches a single new_context call."""
+        config = browser_scraper.config
+        config.proxy = PROXY
+        config.user_agent = "CustomBot/1.0"
+        config.viewport_width = 1920
+        config.viewport_height = 1080
+        config.geolocation = GEOLOCATION
+        config.permissions = ["geolocation"]
+        config.offline = True
+
+        await browser_scraper._initialize()
+
+        ((_, context_options),) = mock_playwright_spa["browser"].new_context.calls
+        assert context_options["proxy"] == PROXY
+        assert context_options["user_agent"] == "CustomBot/1.0"
+        assert context_options["viewport"] == {"width": 1920, "height": 1080}
+        assert context_options["geolocation"] == GEOLOCATION
+        assert context_options["permissions"] == ["geolocation"]
+        assert context_options["offline"] is True
 
     @pytest.mark.asyncio
     async def test_scrape_multiple_concurrent(self, browser_scraper, mock_playwright_spa):
         """Test concurrent scraping of multiple URLs."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_spa["playwright"]
-            )
-
-            urls = [
-                "https://example.com/page1",
-                "https://example.com/page2",
-                "https://example.com/page3",
-            ]
-
+        urls = [
+            "https://example.com/page1",
+            "https://example.com/page2",
+            "https://example.com/page3",
+        ]
+
+        in_flight = peak = 0
+        scrape = browser_scraper._scrape
+
+        async def tracked_scrape(source, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0)  # Let sibling scrapes start while this one is in flight
+                return await scrape(source, **kwargs)
+            finally:
+                in_flight -= 1
+
+        with patch.object(browser_scraper, "_scrape", new=tracked_scrape):
             results = await browser_scraper.scrape_multiple(urls, max_concurrent=2)
 
-            assert len(results) == 3
-            assert all(r.success for r in results)
-            assert all(isinstance(r.data, BrowserPageData) for r in results)
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert all(isinstance(r.data, BrowserPageData) for r in results)
+        assert peak == 2
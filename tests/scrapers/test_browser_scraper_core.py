@@ -1,63 +1,178 @@
 """Core tests for BrowserScraper functionality."""
 
-from unittest.mock import AsyncMock, Mock, patch
+from functools import partial
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 from playwright.async_api import Browser, BrowserContext, Page
 
 from scrap_e.core.config import WebScraperConfig
 from scrap_e.core.exceptions import ConnectionError, ScraperError
+from scrap_e.core.models import ScraperStats
+from scrap_e.scrapers.web import browser_scraper as browser_scraper_module
 from scrap_e.scrapers.web.browser_scraper import BrowserPageData, BrowserScraper
 
+pytestmark = [
+    # The mocks are all awaited; fail loudly if a stray un-awaited coroutine appears
+    pytest.mark.filterwarnings("error::RuntimeWarning"),
+    # Keep the session/module-scoped fixtures on one xdist worker (--dist=loadgroup)
+    pytest.mark.xdist_group("browser_scraper_core"),
+]
+
+# Async tests share one module-wide event loop instead of creating one per test
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+_URL = "https://example.com"
+_DEFAULT_GOTO_KW = {"wait_until": "networkidle", "timeout": 30000}
+_RESP_200 = SimpleNamespace(status=200)
+_RESP_404 = SimpleNamespace(status=404)
+# Shared by every reset; a list because Playwright returns one. Tests must not mutate it
+_COOKIES = [{"name": "test", "value": "cookie"}]
+TEST_HTML = "<html><body>Test Content</body></html>"
+BROWSER_TYPES = ("chromium", "firefox", "webkit")
+
+# spec_set rejects attributes Playwright does not define, catching typos in tests
+_page_mock = partial(AsyncMock, spec_set=Page)
+_context_mock = partial(AsyncMock, spec_set=BrowserContext)
+_browser_mock = partial(AsyncMock, spec_set=Browser)
+
+# Validated once at import; tests that change settings copy rather than mutate them
+_CFG = {
+    "chromium": WebScraperConfig(enable_javascript=True),
+    "firefox": WebScraperConfig(browser_type="firefox"),
+    "webkit": WebScraperConfig(browser_type="webkit"),
+    "viewport": WebScraperConfig(
+        headless=False,
+        browser_args=["--disable-gpu"],
+        viewport_width=1920,
+        viewport_height=1080,
+    ),
+}
+# Expected launch/context kwargs for _CFG["viewport"]; extra args are appended to defaults
+_EXPECTED_LAUNCH = {"headless": False}
+_EXPECTED_EXTRA_ARG = "--disable-gpu"
+_EXPECTED_VIEWPORT = {"width": 1920, "height": 1080}
+
+_TRANSFORM_CASES = [
+    ("  test  ", "strip", "test"),
+    ("Test", "lower", "test"),
+    ("test", "upper", "TEST"),
+    ("123", "int", 123),
+    ("12.34", "float", 12.34),
+    ("true", "bool", True),
+    ("false", "bool", True),  # Non-empty string is truthy
+    ("", "bool", False),
+    ("test", "unknown", "test"),
+    (None, "strip", None),
+]
+
+
+def assert_all_called_once(*mocks: AsyncMock) -> None:
+    """Assert each mock was called exactly once, naming the first that was not."""
+    for mock in mocks:
+        assert mock.call_count == 1, mock
+
+
+@pytest.fixture(scope="session")
+def browser_scraper():
+    """Create one browser scraper for the session; ``_reset_shared_state`` restores it per test.
+
+    The fixture is synchronous so plain (non-async) tests can use it without an event loop.
+    """
+    return BrowserScraper()
+
+
+@pytest.fixture(scope="session")
+def mock_playwright():
+    """Create mock playwright objects once; their methods are restored per test."""
+    return {
+        "playwright": AsyncMock(),
+        "browser": _browser_mock(),
+        "context": _context_mock(),
+        "page": _page_mock(),
+    }
 
-@pytest.fixture
-async def browser_scraper():
-    """Create a browser scraper instance."""
+
+@pytest.fixture(scope="session")
+def mock_reset_plan(mock_playwright):
+    """List each (node, method name, method mock, return value) the scraper touches.
+
+    Restoring from this plan re-binds methods tests replaced and restores their
+    return values and side effects without walking the whole mock tree. It is applied once on creation so
+    module-scoped fixtures see wired mocks before any test runs.
+    """
+    page, context = mock_playwright["page"], mock_playwright["context"]
+    browser, playwright = mock_playwright["browser"], mock_playwright["playwright"]
+    page.url = _URL
+    methods = [
+        (page, "goto", AsyncMock()),
+        (page, "close", AsyncMock()),
+        (page, "evaluate", AsyncMock()),
+        (page, "wait_for_selector", AsyncMock()),
+        (page, "title", AsyncMock(return_value="Test Page")),
+        (page, "content", AsyncMock(return_value=TEST_HTML)),
+        (page, "screenshot", AsyncMock(return_value=b"screenshot_data")),
+        (page, "query_selector_all", AsyncMock(return_value=[])),
+        (context, "new_page", AsyncMock(return_value=page)),
+        (context, "cookies", AsyncMock(return_value=_COOKIES)),
+        (context, "close", AsyncMock()),
+        (browser, "new_context", AsyncMock(return_value=context)),
+        (browser, "close", AsyncMock()),
+        (playwright, "stop", AsyncMock()),
+        *(
+            (getattr(playwright, browser_type), "launch", AsyncMock(return_value=browser))
+            for browser_type in BROWSER_TYPES
+        ),
+    ]
+    plan = [(node, name, method, method.return_value) for node, name, method in methods]
+    _apply_reset_plan(plan)
+    return plan
+
+
+def _apply_reset_plan(plan: list[tuple[Any, str, AsyncMock, Any]]) -> None:
+    """Re-bind each planned method mock, clear its calls and restore its results."""
+    for node, name, method, return_value in plan:
+        setattr(node, name, method)
+        method.reset_mock(return_value=True, side_effect=True)
+        method.return_value = return_value
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_playwright(mock_playwright):
+    """Bind ``async_playwright`` to a manager starting the shared mocks, once per module."""
+    manager = SimpleNamespace(start=AsyncMock(return_value=mock_playwright["playwright"]))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(browser_scraper_module, "async_playwright", lambda: manager)
+        yield
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def initialized_browser_scraper(mock_reset_plan, _patch_playwright):
+    """Initialize a dedicated scraper once per module, as a pooled browser would be.
+
+    It is separate from ``browser_scraper`` so the per-test reset of that scraper's
+    handles does not undo this initialization.
+    """
     scraper = BrowserScraper()
+    await scraper._initialize()
     yield scraper
-    # Cleanup - accessing protected members intentionally for testing
-    if scraper._playwright:
-        await scraper._cleanup()
+    await scraper._cleanup()
 
 
-@pytest.fixture
-def mock_playwright():
-    """Create mock playwright objects."""
-    mock_page = AsyncMock(spec=Page)
-    mock_page.url = "https://example.com"
-    mock_page.title = AsyncMock(return_value="Test Page")
-    mock_page.content = AsyncMock(return_value="<html><body>Test Content</body></html>")
-    mock_page.goto = AsyncMock()
-    mock_page.close = AsyncMock()
-    mock_page.screenshot = AsyncMock(return_value=b"screenshot_data")
-    mock_page.query_selector_all = AsyncMock(return_value=[])
-    mock_page.evaluate = AsyncMock()
-    mock_page.wait_for_selector = AsyncMock()
-
-    mock_context = AsyncMock(spec=BrowserContext)
-    mock_context.new_page = AsyncMock(return_value=mock_page)
-    mock_context.close = AsyncMock()
-    mock_context.cookies = AsyncMock(return_value=[{"name": "test", "value": "cookie"}])
-
-    mock_browser = AsyncMock(spec=Browser)
-    mock_browser.new_context = AsyncMock(return_value=mock_context)
-    mock_browser.close = AsyncMock()
-
-    mock_browser_type = AsyncMock()
-    mock_browser_type.launch = AsyncMock(return_value=mock_browser)
-
-    mock_playwright_instance = AsyncMock()
-    mock_playwright_instance.chromium = mock_browser_type
-    mock_playwright_instance.firefox = mock_browser_type
-    mock_playwright_instance.webkit = mock_browser_type
-    mock_playwright_instance.stop = AsyncMock()
-
-    return {
-        "playwright": mock_playwright_instance,
-        "browser": mock_browser,
-        "context": mock_context,
-        "page": mock_page,
-    }
+@pytest.fixture(autouse=True)
+def _reset_shared_state(browser_scraper, mock_reset_plan):
+    """Restore the shared mock methods before each test and the shared scraper after it."""
+    _apply_reset_plan(mock_reset_plan)
+    config = browser_scraper.config.model_copy(deep=True)
+    yield
+    browser_scraper.config = config
+    browser_scraper.stats = ScraperStats()
+    browser_scraper.extraction_rules = []
+    # The mocks hold no resources, so drop the handles instead of awaiting _cleanup()
+    browser_scraper._playwright = browser_scraper._browser = browser_scraper._context = None
 
 
 class TestBrowserScraperCore:
@@ -65,8 +180,7 @@ class TestBrowserScraperCore:
 
     def test_init(self):
         """Test BrowserScraper initialization."""
-        config = WebScraperConfig(enable_javascript=True)
-        scraper = BrowserScraper(config)
+        scraper = BrowserScraper(_CFG["chromium"])
         assert scraper.config.enable_javascript is True
         assert scraper._playwright is None
         assert scraper._browser is None
@@ -74,204 +188,129 @@ class TestBrowserScraperCore:
 
     def test_init_with_browser_type(self):
         """Test initialization with different browser types."""
-        config = WebScraperConfig(browser_type="firefox")
-        scraper = BrowserScraper(config)
+        scraper = BrowserScraper(_CFG["firefox"])
         assert scraper.config.browser_type == "firefox"
 
-    def test_default_config(self):
+    def test_default_config(self, browser_scraper):
         """Test default configuration."""
-        scraper = BrowserScraper()
-        config = scraper._get_default_config()
+        config = browser_scraper._get_default_config()
         assert config.enable_javascript is True
 
-    def test_scraper_type(self):
+    def test_scraper_type(self, browser_scraper):
         """Test scraper type property."""
-        scraper = BrowserScraper()
-        assert scraper.scraper_type.value == "web_browser"
-
-    @pytest.mark.asyncio
-    async def test_initialize(self, mock_playwright):
-        """Test browser initialization."""
-        scraper = BrowserScraper()
-
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
-
-            await scraper._initialize()
+        assert browser_scraper.scraper_type.value == "web_browser"
 
-            assert scraper._playwright is not None
-            assert scraper._browser is not None
-            assert scraper._context is not None
-            mock_playwright["playwright"].chromium.launch.assert_called_once()
-            mock_playwright["browser"].new_context.assert_called_once()
+    @pytest.mark.parametrize("browser_type", BROWSER_TYPES)
+    @module_loop
+    async def test_initialize_browser_type(self, mock_playwright, browser_type):
+        """Test browser initialization launches the configured browser type."""
+        scraper = BrowserScraper(_CFG[browser_type])
 
-    @pytest.mark.asyncio
-    async def test_initialize_firefox(self, mock_playwright):
-        """Test initialization with the Firefox browser."""
-        scraper = BrowserScraper(WebScraperConfig(browser_type="firefox"))
+        await scraper._initialize()
 
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
+        assert scraper._playwright is not None
+        assert scraper._browser is not None
+        assert scraper._context is not None
+        for name in BROWSER_TYPES:
+            launch = getattr(mock_playwright["playwright"], name).launch
+            assert launch.call_count == (name == browser_type)
+        assert_all_called_once(mock_playwright["browser"].new_context)
 
-            await scraper._initialize()
+    @module_loop
+    async def test_initialize_with_options(self, mock_playwright):
+        """Test initialization with browser options."""
+        scraper = BrowserScraper(_CFG["viewport"])
 
-            mock_playwright["playwright"].firefox.launch.assert_called_once()
+        await scraper._initialize()
 
-    @pytest.mark.asyncio
-    async def test_initialize_webkit(self, mock_playwright):
-        """Test initialization with the WebKit browser."""
-        scraper = BrowserScraper(WebScraperConfig(browser_type="webkit"))
+        launch_kwargs = mock_playwright["playwright"].chromium.launch.call_args.kwargs
+        assert launch_kwargs.items() >= _EXPECTED_LAUNCH.items()
+        assert _EXPECTED_EXTRA_ARG in launch_kwargs["args"]
+        assert (
+            mock_playwright["browser"].new_context.call_args.kwargs["viewport"]
+            == _EXPECTED_VIEWPORT
+        )
 
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
+    def test_reset_plan_restores_return_values(self, mock_playwright, mock_reset_plan):
+        """Test the shared mocks get their planned results back after a test changes them."""
+        page, context = mock_playwright["page"], mock_playwright["context"]
+        page.title.return_value = "Changed"
+        page.content.side_effect = RuntimeError("boom")
+        context.cookies = AsyncMock(return_value=[])
 
-            await scraper._initialize()
+        _apply_reset_plan(mock_reset_plan)
 
-            mock_playwright["playwright"].webkit.launch.assert_called_once()
+        assert page.title.return_value == "Test Page"
+        assert page.content.side_effect is None
+        assert context.cookies.return_value is _COOKIES
 
-    @pytest.mark.asyncio
-    async def test_initialize_with_options(self, mock_playwright):
-        """Test initialization with browser options."""
-        config = WebScraperConfig(
-            headless=False,
-            browser_args=["--disable-gpu"],
-            viewport_width=1920,
-            viewport_height=1080,
-        )
-        scraper = BrowserScraper(config)
-
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
-
-            await scraper._initialize()
-
-            # Check launch was called with headless=False and args
-            launch_call = mock_playwright["playwright"].chromium.launch.call_args
-            assert launch_call[1]["headless"] is False
-            assert "--disable-gpu" in launch_call[1]["args"]
-
-            # Check context was created with viewport
-            context_call = mock_playwright["browser"].new_context.call_args
-            assert context_call[1]["viewport"]["width"] == 1920
-            assert context_call[1]["viewport"]["height"] == 1080
-
-    @pytest.mark.asyncio
-    async def test_cleanup(self, mock_playwright):
-        """Test cleanup of browser resources."""
+    @pytest.mark.parametrize("prewire", [True, False], ids=["resources", "no_resources"])
+    @module_loop
+    async def test_cleanup(self, mock_playwright, prewire):
+        """Test cleanup of browser resources, and that it is safe with none initialized."""
         scraper = BrowserScraper()
+        closers = (
+            mock_playwright["context"].close,
+            mock_playwright["browser"].close,
+            mock_playwright["playwright"].stop,
+        )
+        if prewire:
+            scraper._playwright = mock_playwright["playwright"]
+            scraper._browser = mock_playwright["browser"]
+            scraper._context = mock_playwright["context"]
 
-        scraper._playwright = mock_playwright["playwright"]
-        scraper._browser = mock_playwright["browser"]
-        scraper._context = mock_playwright["context"]
-
-        await scraper._cleanup()
+        await scraper._cleanup()  # Should not raise without resources
 
-        mock_playwright["context"].close.assert_called_once()
-        mock_playwright["browser"].close.assert_called_once()
-        mock_playwright["playwright"].stop.assert_called_once()
+        assert [closer.await_count for closer in closers] == [int(prewire)] * len(closers)
         assert scraper._context is None
         assert scraper._browser is None
         assert scraper._playwright is None
 
-    @pytest.mark.asyncio
-    async def test_cleanup_no_resources(self):
-        """Test cleanup when no resources are initialized."""
-        scraper = BrowserScraper()
-        await scraper._cleanup()  # Should not raise
-
-    @pytest.mark.asyncio
-    async def test_scrape_basic(self, browser_scraper, mock_playwright):
+    @module_loop
+    async def test_scrape_basic(self, initialized_browser_scraper, mock_playwright):
         """Test basic scraping functionality."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
-
-            result = await browser_scraper._scrape("https://example.com")
-
-            assert isinstance(result, BrowserPageData)
-            assert result.url == "https://example.com"
-            assert result.title == "Test Page"
-            assert result.content == "<html><body>Test Content</body></html>"
-            mock_playwright["page"].goto.assert_called_once()
-            mock_playwright["page"].close.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_scrape_with_timeout(self, browser_scraper, mock_playwright):
-        """Test scraping with custom timeout."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
+        result = await initialized_browser_scraper._scrape(_URL)
 
-            await browser_scraper._scrape("https://example.com", timeout=60000)
+        # The already-initialized browser is reused rather than launched again
+        assert initialized_browser_scraper._browser is mock_playwright["browser"]
+        mock_playwright["playwright"].chromium.launch.assert_not_called()
+        assert isinstance(result, BrowserPageData)
+        assert result.url == _URL
+        assert result.title == "Test Page"
+        assert result.content == "<html><body>Test Content</body></html>"
+        assert_all_called_once(mock_playwright["page"].goto, mock_playwright["page"].close)
+
+    @module_loop
+    async def test_scrape_with_timeout(self, initialized_browser_scraper, mock_playwright):
+        """Test scraping with custom timeout."""
+        await initialized_browser_scraper._scrape(_URL, timeout=60000)
 
-            goto_call = mock_playwright["page"].goto.call_args
-            assert goto_call[1]["timeout"] == 60000
+        goto_call = mock_playwright["page"].goto.call_args
+        assert goto_call[1]["timeout"] == 60000
 
-    @pytest.mark.asyncio
-    async def test_scrape_error_handling(self, browser_scraper, mock_playwright):
+    @module_loop
+    async def test_scrape_error_handling(self, initialized_browser_scraper, mock_playwright):
         """Test error handling during scraping."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
-            mock_playwright["page"].goto.side_effect = Exception("Navigation failed")
-
-            with pytest.raises(ScraperError) as exc_info:
-                await browser_scraper._scrape("https://example.com")
-
-            assert "Browser scraping failed" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_navigate_to_page(self, browser_scraper, mock_playwright):
-        """Test page navigation."""
-        browser_scraper._context = mock_playwright["context"]
-        page = mock_playwright["page"]
+        mock_playwright["page"].goto.side_effect = Exception("Navigation failed")
 
-        await browser_scraper._navigate_to_page(page, "https://example.com")
+        with pytest.raises(ScraperError) as exc_info:
+            await initialized_browser_scraper._scrape(_URL)
 
-        page.goto.assert_called_once_with(
-            "https://example.com", wait_until="networkidle", timeout=30000
-        )
+        assert "Browser scraping failed" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_navigate_to_page_with_wait_until(self, browser_scraper, mock_playwright):
-        """Test navigation with different wait_until options."""
+    @pytest.mark.parametrize("wait_until", [None, "domcontentloaded"])
+    @module_loop
+    async def test_navigate_to_page(self, browser_scraper, mock_playwright, wait_until):
+        """Test page navigation with the default and an explicit wait_until."""
         browser_scraper._context = mock_playwright["context"]
         page = mock_playwright["page"]
+        kwargs = {"wait_until": wait_until} if wait_until else {}
 
-        await browser_scraper._navigate_to_page(
-            page, "https://example.com", wait_until="domcontentloaded"
-        )
+        await browser_scraper._navigate_to_page(page, _URL, **kwargs)
 
-        page.goto.assert_called_once_with(
-            "https://example.com", wait_until="domcontentloaded", timeout=30000
-        )
+        page.goto.assert_called_once_with(_URL, **(_DEFAULT_GOTO_KW | kwargs))
 
-    @pytest.mark.asyncio
+    @module_loop
     async def test_navigate_to_page_error(self, browser_scraper, mock_playwright):
         """Test navigation error handling."""
         browser_scraper._context = mock_playwright["context"]
@@ -279,77 +318,59 @@ class TestBrowserScraperCore:
         page.goto.side_effect = Exception("Network error")
 
         with pytest.raises(ConnectionError) as exc_info:
-            await browser_scraper._navigate_to_page(page, "https://example.com")
+            await browser_scraper._navigate_to_page(page, _URL)
 
         assert "Failed to navigate" in str(exc_info.value)
 
-    @pytest.mark.asyncio
+    @module_loop
     async def test_extract_page_data(self, browser_scraper, mock_playwright):
         """Test extracting page data."""
         page = mock_playwright["page"]
-        browser_scraper.config.extract_metadata = True
-        browser_scraper.config.extract_links = True
-        browser_scraper.config.extract_images = True
+        browser_scraper.config = browser_scraper.config.model_copy(
+            update={"extract_metadata": True, "extract_links": True, "extract_images": True}
+        )
 
-        result = await browser_scraper._extract_page_data(page, "https://example.com")
+        result = await browser_scraper._extract_page_data(page, _URL)
 
         assert isinstance(result, BrowserPageData)
-        assert result.url == "https://example.com"
+        assert result.url == _URL
         assert result.title == "Test Page"
         assert result.content == "<html><body>Test Content</body></html>"
         assert result.metadata is not None
         assert result.links is not None
         assert result.images is not None
 
-    @pytest.mark.asyncio
-    async def test_validate_source(self, browser_scraper, mock_playwright):
-        """Test source URL validation."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
+    @module_loop
+    async def test_extract_page_data_from_pooled_page(self, browser_scraper, page_pool):
+        """Test extracting page data from the shared page mock."""
+        result = await browser_scraper._extract_page_data(page_pool, _URL)
 
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_playwright["page"].goto = AsyncMock(return_value=mock_response)
+        assert result.title == "Test Page"
+        assert result.metadata["title"] == "Test Page"
+        page_pool.content.assert_awaited_once()
 
-            await browser_scraper._validate_source("https://example.com")
+    @module_loop
+    async def test_validate_source(self, initialized_browser_scraper, mock_playwright):
+        """Test source URL validation."""
+        mock_playwright["page"].goto = AsyncMock(return_value=_RESP_200)
 
-            mock_playwright["context"].new_page.assert_called_once()
-            mock_playwright["page"].close.assert_called_once()
+        await initialized_browser_scraper._validate_source(_URL)
 
-    @pytest.mark.asyncio
-    async def test_validate_source_error(self, browser_scraper, mock_playwright):
-        """Test source validation with error status."""
-        with patch(
-            "scrap_e.scrapers.web.browser_scraper.async_playwright"
-        ) as mock_async_playwright:
-            mock_async_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright["playwright"]
-            )
+        assert_all_called_once(mock_playwright["context"].new_page, mock_playwright["page"].close)
 
-            mock_response = Mock()
-            mock_response.status = 404
-            mock_playwright["page"].goto = AsyncMock(return_value=mock_response)
+    @module_loop
+    async def test_validate_source_error(self, initialized_browser_scraper, mock_playwright):
+        """Test source validation with error status."""
+        mock_playwright["page"].goto = AsyncMock(return_value=_RESP_404)
 
-            with pytest.raises(ConnectionError) as exc_info:
-                await browser_scraper._validate_source("https://example.com")
+        with pytest.raises(ConnectionError) as exc_info:
+            await initialized_browser_scraper._validate_source(_URL)
 
-            assert "URL returned status 404" in str(exc_info.value)
+        assert "URL returned status 404" in str(exc_info.value)
 
-    def test_apply_transform(self, browser_scraper):
+    @pytest.mark.parametrize(("value", "transform", "expected"), _TRANSFORM_CASES)
+    def test_apply_transform(self, browser_scraper, value, transform, expected):
         """Test value transformations."""
-        assert browser_scraper._apply_transform("  test  ", "strip") == "test"
-        assert browser_scraper._apply_transform("Test", "lower") == "test"
-        assert browser_scraper._apply_transform("test", "upper") == "TEST"
-        assert browser_scraper._apply_transform("123", "int") == 123
-        assert browser_scraper._apply_transform("12.34", "float") == 12.34
-        assert browser_scraper._apply_transform("true", "bool") is True
-        assert (
-            browser_scraper._apply_transform("false", "bool") is True
-        )  # Non-empty string is truthy
-        assert browser_scraper._apply_transform("", "bool") is False
-        assert browser_scraper._apply_transform("test", "unknown") == "test"
-        assert browser_scraper._apply_transform(None, "strip") is None
+        result = browser_scraper._apply_transform(value, transform)
+        assert result == expected
+        assert type(result) is type(expected)
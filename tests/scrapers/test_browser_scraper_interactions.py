@@ -5,20 +5,40 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from playwright.async_api import Page
 
-from scrap_e.core.models import ExtractionRule
+from scrap_e.core.models import ExtractionRule, ScraperStats
 from scrap_e.scrapers.web.browser_scraper import BrowserPageData, BrowserScraper
 
-
-@pytest.fixture
-async def browser_scraper():
-    """Create a browser scraper instance."""
-    scraper = BrowserScraper()
-    yield scraper
-    if scraper._playwright:
-        await scraper._cleanup()
-
-
-@pytest.fixture
+# Keep the class-scoped fixtures on one xdist worker (--dist=loadgroup)
+pytestmark = pytest.mark.xdist_group("browser_scraper_interactions")
+
+# Page attributes tests may replace or call; restored from the originals before each test
+_PAGE_METHODS = (
+    "title",
+    "content",
+    "goto",
+    "close",
+    "screenshot",
+    "query_selector_all",
+    "evaluate",
+    "wait_for_selector",
+    "click",
+    "fill",
+    "select_option",
+    "check",
+    "uncheck",
+    "hover",
+    "keyboard",
+    "on",
+)
+
+
+@pytest.fixture(scope="class")
+def browser_scraper():
+    """Create one browser scraper per test class; ``reset_scraper`` restores it per test."""
+    return BrowserScraper()
+
+
+@pytest.fixture(scope="class")
 def mock_page():
     """Create a mock page object."""
     page = AsyncMock(spec=Page)
@@ -43,7 +63,14 @@ def mock_page():
     return page
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
+def page_methods(mock_page):
+    """Snapshot the original page method mocks and results so tests can swap them freely."""
+    methods = {name: getattr(mock_page, name) for name in _PAGE_METHODS}
+    return {name: (method, method.return_value) for name, method in methods.items()}
+
+
+@pytest.fixture(scope="class")
 def mock_playwright_full(mock_page):
     """Create a full mock playwright setup."""
     mock_context = AsyncMock()
@@ -69,6 +96,25 @@ def mock_playwright_full(mock_page):
     }
 
 
+@pytest.fixture(autouse=True)
+def reset_scraper(browser_scraper, mock_page, page_methods, mock_playwright_full):
+    """Restore the shared scraper and mocks to their defaults around each test."""
+    for name, (method, return_value) in page_methods.items():
+        setattr(mock_page, name, method)
+        method.reset_mock(return_value=True, side_effect=True)
+        method.return_value = return_value
+    for node in ("context", "browser", "playwright"):
+        mock_playwright_full[node].reset_mock()
+    config = browser_scraper.config.model_copy(deep=True)
+    yield
+    browser_scraper.config = config
+    browser_scraper.stats = ScraperStats()
+    browser_scraper.extraction_rules = []
+    # The mocks hold no resources, so drop the handles instead of awaiting _cleanup();
+    # the next test then initializes through its own patched async_playwright
+    browser_scraper._playwright = browser_scraper._browser = browser_scraper._context = None
+
+
 class TestBrowserScraperInteractions:
     """Tests for browser page interaction features."""
 
@@ -85,7 +131,7 @@ class TestBrowserScraperInteractions:
     @pytest.mark.asyncio
     async def test_wait_for_content_with_wait_time(self, browser_scraper, mock_page):
         """Test waiting with additional wait time."""
-        with patch("asyncio.sleep") as mock_sleep:
+        with patch("scrap_e.scrapers.web.browser_scraper._sleep") as mock_sleep:
             await browser_scraper._wait_for_content(mock_page, wait_time=2)
             mock_sleep.assert_called_once_with(2)
 
@@ -94,7 +140,7 @@ class TestBrowserScraperInteractions:
         """Test waiting without a selector."""
         browser_scraper.config.wait_for_selector = None
 
-        with patch("asyncio.sleep") as mock_sleep:
+        with patch("scrap_e.scrapers.web.browser_scraper._sleep") as mock_sleep:
             await browser_scraper._wait_for_content(mock_page, wait_time=1)
             mock_sleep.assert_called_once_with(1)
             mock_page.wait_for_selector.assert_not_called()
@@ -34,6 +34,15 @@ class TestExtractionRule:
         assert rule.transform is None
         assert rule.multiple is False
 
+    def test_extraction_rule_compiled_regex(self):
+        """Test regex patterns are compiled once and shared between rules."""
+        rule = ExtractionRule(name="price", regex=r"\$(\d+\.\d+)")
+        other = ExtractionRule(name="price_again", regex=r"\$(\d+\.\d+)")
+
+        assert rule.compiled_regex.search("Price: $9.99").group(1) == "9.99"
+        assert rule.compiled_regex is other.compiled_regex
+        assert ExtractionRule(name="test", selector="h1").compiled_regex is None
+
 
 class TestScraperMetadata:
     """Tests for ScraperMetadata model."""
@@ -1,7 +1,10 @@
 """Core HTML parser functionality tests."""
 
+from bs4 import SoupStrainer
+
+from scrap_e.scrapers.web import parser as parser_module
 from scrap_e.scrapers.web.parser import HtmlParser
-from tests.fixtures import EMPTY_HTML, MALFORMED_HTML
+from tests.fixtures import COMPLEX_HTML, EMPTY_HTML, MALFORMED_HTML
 
 
 class TestHtmlParserCore:
@@ -27,6 +30,27 @@ class TestHtmlParserCore:
         tree = parser.lxml_tree
         assert tree is not None
 
+    def test_parser_unknown_type_falls_back(self):
+        """Test an unavailable BeautifulSoup backend falls back to html.parser."""
+        parser = HtmlParser("<html><body><h1>Test</h1></body></html>", "not-a-parser")
+        assert parser.soup.find("h1").text == "Test"
+
+    def test_parser_parse_only_strains_soup(self):
+        """Test parse_only limits the soup to matching elements."""
+        parser = HtmlParser(COMPLEX_HTML, parse_only=SoupStrainer("a"))
+        links = parser.soup.find_all("a")
+
+        assert links
+        assert parser.soup.find("title") is None
+        assert len(links) == len(HtmlParser(COMPLEX_HTML).soup.find_all("a"))
+
+    def test_parser_from_strainer(self):
+        """Test from_strainer builds a soup holding only the strained elements."""
+        parser = HtmlParser.from_strainer(COMPLEX_HTML, SoupStrainer("nav"))
+
+        assert [tag.name for tag in parser.soup.contents] == ["nav"]
+        assert parser.lxml_tree.find(".//title") is not None
+
     def test_parser_empty_html(self):
         """Test parser with empty HTML."""
         parser = HtmlParser(EMPTY_HTML)
@@ -73,3 +97,71 @@ class TestHtmlParserCore:
         assert "é" in text
         assert "à" in text
         assert "ü" in text
+
+    def test_parser_soup_fallback_matches_selectolax(self, monkeypatch):
+        """Test the BeautifulSoup fallback yields the same data as the selectolax path."""
+        fast = HtmlParser(COMPLEX_HTML)
+        expected = (fast.extract_metadata(), fast.extract_links(), fast.extract_images())
+
+        monkeypatch.setattr(parser_module, "SELECTOLAX_AVAILABLE", False)
+        fallback = HtmlParser(COMPLEX_HTML)
+
+        assert fallback.selectolax_tree is None
+        assert fallback.extract_metadata() == expected[0]
+        assert fallback.extract_links() == expected[1]
+        assert fallback.extract_images() == expected[2]
+
+    def test_parser_strained_extraction_matches_fallback(self, monkeypatch):
+        """Test a strained parser extracts the same data with or without selectolax."""
+        strainer = SoupStrainer("main")
+        strained = HtmlParser.from_strainer(COMPLEX_HTML, strainer)
+        expected = (
+            strained.extract_metadata(),
+            strained.extract_links(),
+            strained.extract_images(),
+        )
+
+        monkeypatch.setattr(parser_module, "SELECTOLAX_AVAILABLE", False)
+        fallback = HtmlParser.from_strainer(COMPLEX_HTML, strainer)
+
+        assert fallback.extract_metadata() == expected[0]
+        assert fallback.extract_links() == expected[1]
+        assert fallback.extract_images() == expected[2]
+        # The page's links all sit in <nav>, outside the strained <main>
+        assert expected[1] == []
+        assert HtmlParser(COMPLEX_HTML).extract_links()
+
+    def test_parser_query_memoized(self):
+        """Test query results are memoized per parser and per root node."""
+        parser = HtmlParser(COMPLEX_HTML)
+
+        links = parser.query("a")
+        assert links
+        assert parser.query("a") is links
+
+        nav = parser.query("nav")[0]
+        nav_links = parser.query_within(nav, "a")
+        assert parser.query_within(nav, "a") is nav_links
+        assert len(nav_links) <= len(links)
+
+    def test_parser_query_cache_is_bounded_and_clearable(self):
+        """Test the query cache evicts old entries and can be cleared after edits."""
+        parser = HtmlParser(COMPLEX_HTML)
+
+        links = parser.query("a")
+        for i in range(parser_module._QUERY_CACHE_SIZE):
+            parser.query(f"a:nth-of-type({i + 1})")
+        assert len(parser._query_cache) == parser_module._QUERY_CACHE_SIZE
+        assert parser.query("a") is not links
+
+        links[0].decompose()
+        parser.clear_query_cache()
+        assert len(parser.query("a")) == len(links) - 1
+
+    def test_parser_select_matches_soup_select(self):
+        """Test select matches soup.select without memoizing its results."""
+        parser = HtmlParser(COMPLEX_HTML)
+
+        links = parser.select("nav a")
+        assert links == parser.soup.select("nav a")
+        assert parser.select("nav a") is not links
@@ -1,8 +1,13 @@
 """Tests for content extraction methods."""
 
+import math
+import re
+
+import pytest
+
 from scrap_e.core.models import ExtractionRule
 from scrap_e.scrapers.web.parser import HtmlParser
-from tests.fixtures import COMPLEX_HTML, FORM_HTML, TABLE_HTML
+from tests.fixtures import COMPLEX_HTML, EXTRACTION_RULES, FORM_HTML, MALFORMED_HTML, TABLE_HTML
 
 
 class TestMetadataExtraction:
@@ -77,6 +82,28 @@ class TestMetadataExtraction:
         result = parser.extract_with_rule(rule_currency)
         assert result == "USD"
 
+    def test_extract_json_ld_with_non_finite_numbers(self):
+        """Test JSON-LD with NaN/Infinity, which the stdlib decoder accepts, is kept."""
+        html = """
+        <html>
+            <head>
+                <script type="application/ld+json">
+                {"@type": "Product", "name": "Widget", "rating": NaN, "stock": Infinity}
+                </script>
+            </head>
+        </html>
+        """
+        parser = HtmlParser(html)
+
+        schema = parser.extract_metadata()["schema_data"]
+        assert len(schema) == 1
+        assert schema[0]["name"] == "Widget"
+        assert math.isnan(schema[0]["rating"])
+        assert schema[0]["stock"] == math.inf
+
+        rule = ExtractionRule(name="rating", json_path="rating")
+        assert math.isnan(parser.extract_with_rule(rule))
+
     def test_extract_invalid_json_ld(self):
         """Test extraction with invalid JSON-LD."""
         html = """
@@ -152,6 +179,15 @@ class TestContentExtraction:
         assert first_img is not None
         assert first_img["alt"] == "Test Image"
 
+    def test_extract_links_and_images_iter(self):
+        """Test the generator APIs yield the same records as the list APIs."""
+        parser = HtmlParser(COMPLEX_HTML)
+
+        links = parser.extract_links_iter("https://example.com")
+        assert next(links) == parser.extract_links("https://example.com")[0]
+        assert list(parser.extract_links_iter()) == parser.extract_links()
+        assert list(parser.extract_images_iter()) == parser.extract_images()
+
     def test_extract_tables(self):
         """Test table extraction from HTML."""
         parser = HtmlParser(TABLE_HTML)
@@ -274,6 +310,16 @@ class TestRegexExtraction:
         result = parser.extract_with_rule(version_rule)
         assert result == "2.1.3"
 
+    @pytest.mark.parametrize("rule_name", ["price", "email"])
+    def test_regex_rules_match_dfa_backend(self, dfa_regex, rule_name):
+        """Test the stdlib and re2 engines agree on each regex rule over malformed HTML."""
+        rule = EXTRACTION_RULES[rule_name]
+        stdlib_matches = re.findall(rule.regex, MALFORMED_HTML)
+
+        assert stdlib_matches
+        assert dfa_regex(rule_name, MALFORMED_HTML) == stdlib_matches
+        assert HtmlParser(MALFORMED_HTML).extract_with_rule(rule) == stdlib_matches[0]
+
 
 class TestAttributeExtraction:
     """Test element attribute extraction."""
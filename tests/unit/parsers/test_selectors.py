@@ -1,7 +1,7 @@
 """Tests for CSS and XPath selectors."""
 
 from scrap_e.core.models import ExtractionRule
-from scrap_e.scrapers.web.parser import HtmlParser
+from scrap_e.scrapers.web.parser import HtmlParser, _compile_xpath
 from tests.fixtures import COMPLEX_HTML
 
 
@@ -229,3 +229,47 @@ class TestXPathSelectors:
         rule = ExtractionRule(name="div", xpath="//div")
         result = parser.extract_with_rule(rule)
         assert "Regular content" in str(result)
+
+
+class TestCompiledSelectorCache:
+    """Test compiled selectors are shared across parsers."""
+
+    def test_selectors_compiled_once(self):
+        """Test repeated XPath rules reuse the cached compiled expression.
+
+        CSS selectors rely on soupsieve's own compile cache.
+        """
+        rule = ExtractionRule(name="links", xpath="//a/@href", multiple=True)
+        HtmlParser(COMPLEX_HTML).extract_with_rule(rule)
+        xpath_hits = _compile_xpath.cache_info().hits
+
+        assert HtmlParser(COMPLEX_HTML).extract_with_rule(rule)
+
+        assert _compile_xpath.cache_info().hits == xpath_hits + 1
+
+    def test_extract_with_rules_matches_per_rule_extraction(self):
+        """Test batched CSS extraction agrees with extracting rule by rule."""
+        rules = [
+            ExtractionRule(name="title", selector="h1"),
+            ExtractionRule(name="links", selector="nav a", attribute="href", multiple=True),
+            ExtractionRule(name="missing", selector=".nonexistent", default="N/A"),
+            ExtractionRule(name="empty", selector=".nonexistent", multiple=True),
+            ExtractionRule(name="xpath_title", xpath="//h1/text()"),
+        ]
+        parser = HtmlParser(COMPLEX_HTML)
+
+        expected = {rule.name: parser.extract_with_rule(rule) for rule in rules}
+
+        assert parser.extract_with_rules(rules) == expected
+        assert expected["missing"] == "N/A"
+
+    def test_extract_with_rules_invalid_selector_falls_back(self):
+        """Test an invalid selector only affects its own rule."""
+        rules = [
+            ExtractionRule(name="title", selector="h1"),
+            ExtractionRule(name="bad", selector="[[invalid", default="fallback"),
+        ]
+        result = HtmlParser(COMPLEX_HTML).extract_with_rules(rules)
+
+        assert result["title"]
+        assert result["bad"] == "fallback"